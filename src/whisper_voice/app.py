@@ -107,7 +107,6 @@ class App(IPCMixin, RecordingMixin, PipelineMixin, CommandsMixin, SwitchingMixin
         self._grammar_last_check: float = 0.0
         self._grammar_lock = threading.Lock()
         self._state_lock = threading.Lock()
-        self._max_timer = None
         self._last_tap_time = 0.0
         self._key_pressed = False
         self._hold_timer: Optional[threading.Timer] = None
@@ -533,10 +532,6 @@ class App(IPCMixin, RecordingMixin, PipelineMixin, CommandsMixin, SwitchingMixin
         self.recorder.stop_monitoring()
 
         # Cancel any running timer
-        if self._max_timer:
-            self._max_timer.cancel()
-            self._max_timer = None
-
         if self._idle_timer:
             self._idle_timer.cancel()
             self._idle_timer = None
@@ -5,8 +5,7 @@
 import threading
 from pathlib import Path
 
-import numpy as np
-
+from .audio_processor import abs_peak
 from .utils import is_hallucination, strip_hallucination_lines
 
 
@@ -210,7 +209,7 @@ class CommandsMixin:
 
             audio = self.recorder.stop()
 
-            if len(audio) == 0 or np.max(np.abs(audio)) == 0:
+            if abs_peak(audio) == 0:
                 if len(audio) > 0:
                     self.recorder.reset_audio_host(close_stream=False)
                 formatter = getattr(self.recorder, "no_signal_error_message", None)
@@ -6,8 +6,6 @@ import subprocess
 import threading
 import time
 
-import numpy as np
-
 from . import recovery
 from .dictation_commands import apply_dictation_commands
 from .long_session import LONG_SESSION_THRESHOLD_SECONDS, SessionChunk, SessionLog
@@ -16,20 +14,48 @@ from .utils import (
     CLIPBOARD_TIMEOUT,
     LOG_TRUNCATE,
     PREVIEW_TRUNCATE,
+    QOS_CLASS_USER_INITIATED,
     is_hallucination,
     log,
     play_sound,
     send_notification,
+    set_thread_qos,
     strip_hallucination_lines,
     truncate,
 )
 from .watchdog import TimedOut, run_with_timeout
 
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+except Exception:  # AppKit unavailable: every clipboard write goes through pbcopy
+    NSPasteboard = None
+    NSPasteboardTypeString = None
+
 _TRANSCRIBE_WATCHDOG_SECONDS = 20 * 60
 _GRAMMAR_WATCHDOG_SECONDS = 90
 _PASTE_WATCHDOG_SECONDS = 8
 _MIN_CLIP_SECONDS = 0.5
 _TRANSCRIBE_HEARTBEAT_SECONDS = 2.0
+_GRAMMAR_PROBE_WAIT_SECONDS = 5.0
+
+
+def _set_clipboard_text(text: str):
+    """Put text on the general pasteboard. Raises on failure.
+
+    Writes in-process through NSPasteboard; spawning pbcopy costs a
+    fork+exec per copy. pbcopy stays as the fallback when AppKit is missing
+    or the pasteboard refuses the write.
+    """
+    if NSPasteboard is not None:
+        try:
+            pb = NSPasteboard.generalPasteboard()
+            pb.clearContents()
+            if pb.setString_forType_(text, NSPasteboardTypeString):
+                return
+            log("Pasteboard write refused; falling back to pbcopy", "WARN")
+        except Exception as e:
+            log(f"Pasteboard write failed ({type(e).__name__}: {e}); falling back to pbcopy", "WARN")
+    subprocess.run(['pbcopy'], input=text.encode(), check=True, timeout=CLIPBOARD_TIMEOUT)
 
 
 class PipelineMixin:
@@ -39,8 +65,13 @@ class PipelineMixin:
     # Processing pipeline
     # ------------------------------------------------------------------
 
-    def _process(self, audio, *, paste_at_cursor: bool = False):
-        """Process recorded audio: transcribe, fix grammar, deliver text."""
+    def _process(self, audio, *, paste_at_cursor: bool = False, peak_level: float | None = None):
+        """Process recorded audio: transcribe, fix grammar, deliver text.
+
+        ``peak_level`` is the absolute peak already measured by the caller;
+        when given, the raw-audio fallback reuses it instead of rescanning.
+        """
+        set_thread_qos(QOS_CLASS_USER_INITIATED)
         if self._touch_model_activity() is False:
             self._show_error("Model reload failed", "Failed to reload transcription engine")
             return
@@ -51,7 +82,8 @@ class PipelineMixin:
             config = self.config
 
             # 0a. Reject accidental short taps before running VAD/STFT/engine.
-            clip_seconds = len(audio) / config.audio.sample_rate if len(audio) else 0.0
+            n_samples = len(audio)
+            clip_seconds = n_samples / config.audio.sample_rate if n_samples else 0.0
             if clip_seconds < _MIN_CLIP_SECONDS:
                 log(f"Clip too short ({clip_seconds:.2f}s) — ignoring", "WARN")
                 self._show_error("Too short", f"Clip too short ({clip_seconds:.2f}s)")
@@ -66,6 +98,13 @@ class PipelineMixin:
             _raw_save_thread = threading.Thread(target=_save_raw, daemon=True)
             _raw_save_thread.start()
 
+            # Probe the grammar backend while audio processing and
+            # transcription run, so the result is known by the grammar step.
+            _grammar_probe_thread = threading.Thread(
+                target=self._check_grammar_connection, daemon=True, name="grammar-probe",
+            )
+            _grammar_probe_thread.start()
+
             recovery.mark_processing(self.backup.audio_path)
             marker_written = True
 
@@ -77,22 +116,24 @@ class PipelineMixin:
             except Exception as e:
                 log(f"Audio processing failed: {e}", "ERR")
                 log("Falling back to raw audio for transcription", "WARN")
-                from .audio_processor import ProcessedAudio
+                from .audio_processor import ProcessedAudio, abs_peak
+                if peak_level is None:
+                    peak_level = abs_peak(audio)
                 processed = ProcessedAudio(
                     audio=audio,
                     raw_audio=audio,
                     has_speech=True,
                     speech_ratio=1.0,
-                    peak_level=float(np.max(np.abs(audio))) if len(audio) > 0 else 0.0,
-                    duration=len(audio) / config.audio.sample_rate,
-                    segments=[(0, len(audio))],
+                    peak_level=peak_level,
+                    duration=clip_seconds,
+                    segments=[(0, n_samples)],
                 )
 
             _raw_save_thread.join(timeout=5.0)
             if _raw_save_thread.is_alive():
                 log("Raw audio save is taking unusually long (I/O slow?)", "WARN")
             elif _raw_save_result[0]:
-                log(f"Raw audio saved ({len(audio) / config.audio.sample_rate:.1f}s)", "OK")
+                log(f"Raw audio saved ({clip_seconds:.1f}s)", "OK")
             else:
                 log("CRITICAL: Raw audio save failed! Recording exists only in memory.", "ERR")
 
@@ -109,6 +150,7 @@ class PipelineMixin:
             # next so a mid-session crash loses at most one chunk of work.
             is_long = duration_seconds >= LONG_SESSION_THRESHOLD_SECONDS
             if is_long:
+                _grammar_probe_thread.join(timeout=_GRAMMAR_PROBE_WAIT_SECONDS)
                 original_raw, final_text, err = self._process_long_session(
                     audio, processed, config,
                 )
@@ -145,7 +187,7 @@ class PipelineMixin:
                         return
 
                 self.backup.save_raw(raw_text)
-                log(f"Raw: {truncate(raw_text, LOG_TRUNCATE)}", "OK")
+                log(f"Raw: {raw_text if len(raw_text) <= LOG_TRUNCATE else truncate(raw_text, LOG_TRUNCATE)}", "OK")
 
                 # Snapshot before dictation mutates raw_text.
                 original_raw = raw_text
@@ -153,8 +195,9 @@ class PipelineMixin:
                 # 3. Dictation commands (before grammar so grammar sees punctuation we inserted)
                 raw_text = self._apply_dictation_commands(raw_text)
 
-                # 4. Grammar correction
-                self._check_grammar_connection()
+                # 4. Grammar correction. Bounded wait: a hung probe leaves
+                # the previous readiness in place rather than stalling delivery.
+                _grammar_probe_thread.join(timeout=_GRAMMAR_PROBE_WAIT_SECONDS)
                 final_text = self._apply_grammar(raw_text)
 
                 # 5. Vocabulary replacements (last text transformation)
@@ -173,8 +216,13 @@ class PipelineMixin:
 
             # 7. Send result
             if clipboard_ok:
-                self._show_success(final_text, pasted=should_paste)
-                self._notify("Transcription Complete", truncate(final_text, PREVIEW_TRUNCATE))
+                # Most dictations fit the preview; skip the call when they do.
+                preview = (
+                    final_text if len(final_text) <= PREVIEW_TRUNCATE
+                    else truncate(final_text, PREVIEW_TRUNCATE)
+                )
+                self._show_success(final_text, pasted=should_paste, preview=preview)
+                self._notify("Transcription Complete", preview)
             else:
                 log("Text saved but clipboard failed. Use 'Copy Last' to copy.", "WARN")
                 self._notify("Clipboard Failed", "Text saved. Use 'Copy Last' to copy.")
@@ -216,17 +264,19 @@ class PipelineMixin:
         self._send_state_error(status)
         threading.Timer(2.0, self._reset_to_idle).start()
 
-    def _show_success(self, text: str, *, pasted: bool | None = None):
-        """Display success state."""
+    def _show_success(self, text: str, *, pasted: bool | None = None, preview: str | None = None):
+        """Display success state. ``preview`` reuses an already-truncated copy of ``text``."""
         if self.config.ui.sounds_enabled:
             play_sound("Glass")
         if pasted is None:
             pasted = self.config.ui.auto_paste
+        if preview is None:
+            preview = text if len(text) <= PREVIEW_TRUNCATE else truncate(text, PREVIEW_TRUNCATE)
         if pasted:
-            log(f"Pasted: {truncate(text, PREVIEW_TRUNCATE)}", "OK")
+            log(f"Pasted: {preview}", "OK")
             self._send_state_done(text, status="Pasted!")
         else:
-            log(f"Copied: {truncate(text, PREVIEW_TRUNCATE)}", "OK")
+            log(f"Copied: {preview}", "OK")
             self._send_state_done(text, status="Copied!")
         self._send_history_update()
         threading.Timer(1.5, self._reset_to_idle).start()
@@ -237,6 +287,11 @@ class PipelineMixin:
 
     def _check_grammar_connection(self):
         """Check and update grammar backend availability (lazy reconnect)."""
+        # Lock-free fast path for the common case (healthy, recently probed).
+        # Both fields are single attribute loads, atomic under the GIL; a
+        # stale read only means falling through to the locked check below.
+        if self._grammar_ready and time.monotonic() - self._grammar_last_check < 30.0:
+            return
         with self._grammar_lock:
             grammar = self.grammar
             if not self.config.grammar.enabled or grammar is None:
@@ -376,7 +431,7 @@ class PipelineMixin:
     def _copy_to_clipboard(self, text: str, show_error: bool = True) -> bool:
         """Copy text to clipboard. Returns True on success."""
         try:
-            subprocess.run(['pbcopy'], input=text.encode(), check=True, timeout=CLIPBOARD_TIMEOUT)
+            _set_clipboard_text(text)
             return True
         except Exception as e:
             log(f"Copy failed: {e}", "ERR")
@@ -422,7 +477,7 @@ class PipelineMixin:
             saved = subprocess.run(['pbpaste'], capture_output=True, timeout=CLIPBOARD_TIMEOUT)
             saved_content = saved.stdout if saved.returncode == 0 else None
 
-            subprocess.run(['pbcopy'], input=text.encode(), check=True, timeout=CLIPBOARD_TIMEOUT)
+            _set_clipboard_text(text)
             time.sleep(0.05)
 
             result = subprocess.run(
@@ -464,6 +519,7 @@ class PipelineMixin:
             self._busy = True
 
         def go():
+            set_thread_qos(QOS_CLASS_USER_INITIATED)
             try:
                 self._current_status = "Retrying..."
                 self._send_state_update()
@@ -623,7 +679,9 @@ class PipelineMixin:
                     all_text.append(cleaned)
         if failed:
             log(f"Warning: {len(failed)}/{len(segments)} segments failed: {failed}", "WARN")
-        raw_text = " ".join(all_text).strip() if all_text else ""
+        # str.join sizes the result once and copies each piece once; the
+        # pieces are already stripped by strip_hallucination_lines.
+        raw_text = " ".join(all_text)
         return (raw_text or None), (None if raw_text else "No speech")
 
 # Crash-recovery entry points live in :mod:`whisper_voice.app_recovery`.
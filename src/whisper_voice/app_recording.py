@@ -7,14 +7,17 @@ import time
 
 from pynput import keyboard
 
+from .ipc_server import IDLE_STATE_FRAME, recording_tick_frame
 from .utils import (
     C_BOLD,
     C_CYAN,
     C_RESET,
     C_YELLOW,
     DURATION_UPDATE_INTERVAL,
+    QOS_CLASS_UTILITY,
     log,
     play_sound,
+    set_thread_qos,
 )
 
 
@@ -197,13 +200,11 @@ class RecordingMixin:
         self._hold_recording = False
         if self._key_interceptor:
             self._key_interceptor.set_recording_active(False)
-        if self._max_timer:
-            self._max_timer.cancel()
-            self._max_timer = None
         # Hold _state_lock so a concurrent release-stop can't hand the same
-        # audio to the pipeline while we're discarding it.
+        # audio to the pipeline while we're discarding it. _busy means a
+        # stop already claimed this recording.
         with self._state_lock:
-            if not self.recorder.recording:
+            if not self.recorder.recording or self._busy:
                 return
             self.recorder.stop()
             self.recorder.start_monitoring()
@@ -245,27 +246,15 @@ class RecordingMixin:
         self._current_status = "Recording..."
         self._send_state_update()
 
-        # Start duration update thread
+        # Duration updates; this loop also enforces max_duration
         threading.Thread(target=self._update_duration, daemon=True).start()
 
-        # Start max duration timer
-        if self.config.audio.max_duration > 0:
-            self._max_timer = threading.Timer(
-                self.config.audio.max_duration,
-                self._auto_stop,
-            )
-            self._max_timer.daemon = True
-            self._max_timer.start()
-
     def _stop_recording(self):
         """Stop recording and process audio."""
-        import numpy as np
+        from .audio_processor import abs_peak
 
         if self._key_interceptor:
             self._key_interceptor.set_recording_active(False)
-        if self._max_timer:
-            self._max_timer.cancel()
-            self._max_timer = None
 
         with self._state_lock:
             if not self.recorder.recording:
@@ -280,53 +269,46 @@ class RecordingMixin:
             # recording could be delivered as copy-only.
             paste_at_cursor = self._hold_recording
             self._hold_recording = False
+            # Claim the stop: _busy turns away concurrent stop/cancel/start
+            # while recorder.stop() closes the stream outside the lock.
+            self._busy = True
 
-            try:
-                audio = self.recorder.stop()
-            except Exception as e:
-                log(f"Recorder stop error: {e}", "ERR")
-                self._send_state_error("Record error")
-                play_sound("Basso")
-                threading.Timer(2.0, self._reset_to_idle).start()
-                self.recorder.start_monitoring()
-                return
+        try:
+            audio = self.recorder.stop()
+        except Exception as e:
+            log(f"Recorder stop error: {e}", "ERR")
+            self._abort_stop("Record error")
+            return
 
-            dur = len(audio) / self.config.audio.sample_rate if len(audio) > 0 else 0
+        n_samples = len(audio)
+        dur = n_samples / self.config.audio.sample_rate if n_samples > 0 else 0
 
-            # Reject empty recordings
-            if len(audio) == 0:
-                log("No audio captured", "WARN")
-                self._send_state_error("No audio")
-                play_sound("Basso")
-                threading.Timer(2.0, self._reset_to_idle).start()
-                self.recorder.start_monitoring()
-                return
+        # Reject empty recordings
+        if n_samples == 0:
+            log("No audio captured", "WARN")
+            self._abort_stop("No audio")
+            return
 
-            # Detect all-zeros audio (mic permission issue)
-            if np.max(np.abs(audio)) == 0:
-                error = "Mic permission?"
-                formatter = getattr(self.recorder, "no_signal_error_message", None)
-                if callable(formatter):
-                    error = formatter()
-                log(error, "ERR")
-                self.recorder.reset_audio_host(close_stream=False)
-                self._send_state_error(error)
-                play_sound("Basso")
-                threading.Timer(2.0, self._reset_to_idle).start()
-                self.recorder.start_monitoring()
-                return
+        # Detect all-zeros audio (mic permission issue). The peak is
+        # handed to _process so it never rescans the buffer.
+        peak = abs_peak(audio)
+        if peak == 0:
+            error = "Mic permission?"
+            formatter = getattr(self.recorder, "no_signal_error_message", None)
+            if callable(formatter):
+                error = formatter()
+            log(error, "ERR")
+            self.recorder.reset_audio_host(close_stream=False)
+            self._abort_stop(error)
+            return
 
-            # Check min_duration
-            if self.config.audio.min_duration > 0 and dur < self.config.audio.min_duration:
-                log(f"Too short ({dur:.1f}s)", "WARN")
-                self._send_state_error("Too short")
-                play_sound("Basso")
-                threading.Timer(2.0, self._reset_to_idle).start()
-                self.recorder.start_monitoring()
-                return
+        # Check min_duration
+        if self.config.audio.min_duration > 0 and dur < self.config.audio.min_duration:
+            log(f"Too short ({dur:.1f}s)", "WARN")
+            self._abort_stop("Too short")
+            return
 
-            log(f"Recorded {dur:.1f}s", "OK")
-            self._busy = True
+        log(f"Recorded {dur:.1f}s", "OK")
 
         # Flip the pill to "Processing…" immediately so users get instant
         # feedback. Without this, the overlay sits on the last recording
@@ -334,14 +316,24 @@ class RecordingMixin:
         self._current_status = "Processing..."
         self._send_state_update(phase="processing", status_text="Processing...")
 
-        # Start processing outside the lock
         threading.Thread(
             target=self._process,
             args=(audio,),
-            kwargs={"paste_at_cursor": paste_at_cursor},
+            kwargs={"paste_at_cursor": paste_at_cursor, "peak_level": peak},
             daemon=True,
         ).start()
 
+    def _abort_stop(self, error: str):
+        """Surface a rejected recording and release the claim _stop_recording took."""
+        self._send_state_error(error)
+        play_sound("Basso")
+        threading.Timer(2.0, self._reset_to_idle).start()
+        # Same order as the pipeline's exit: monitor back up before _busy
+        # drops, so a quick re-press can't race the monitor rebuild.
+        with self._state_lock:
+            self.recorder.start_monitoring()
+            self._busy = False
+
     def _auto_stop(self):
         """Auto-stop recording when max duration exceeded."""
         if self.recorder.recording:
@@ -349,33 +341,33 @@ class RecordingMixin:
             self._stop_recording()
 
     def _update_duration(self):
-        """Send state updates with current duration and RMS while recording."""
+        """Send state updates with current duration and RMS while recording.
+
+        Sleeps on the recorder's stop event rather than a fixed sleep, so the
+        thread exits the moment recording ends instead of one tick later.
+        Ticks are posted to the IPC server's single latest-state slot, which
+        its writer thread drains: a tick never waits on the socket, and a
+        burst collapses to the newest values instead of queueing stale ones.
+        Also enforces ``max_duration``, so no separate timer thread is needed.
+        """
+        set_thread_qos(QOS_CLASS_UTILITY)
+        recorder = self.recorder
+        max_duration = self.config.audio.max_duration
         warned_long = False
-        while self.recorder.recording:
-            dur = self.recorder.duration
-            level = self.recorder.rms_level
+        while recorder.recording:
+            dur = recorder.duration
+            if max_duration > 0 and dur >= max_duration:
+                self._auto_stop()
+                return
             if dur > 1800 and not warned_long:
                 log("Recording is very long (>30 min) - consider stopping to avoid memory issues", "WARN")
                 warned_long = True
-            self.ipc.send({
-                "type": "state_update",
-                "phase": "recording",
-                "duration_seconds": dur,
-                "rms_level": level,
-                "text": None,
-                "status_text": "Recording...",
-            })
-            time.sleep(DURATION_UPDATE_INTERVAL)
+            self.ipc.send_frame(recording_tick_frame(dur, recorder.rms_level))
+            if recorder.wait_for_stop(DURATION_UPDATE_INTERVAL):
+                break
 
     def _reset_to_idle(self):
         """Send idle state to Swift."""
         if not self._busy and not self.recorder.recording:
             self._current_status = "Ready"
-            self.ipc.send({
-                "type": "state_update",
-                "phase": "idle",
-                "duration_seconds": 0.0,
-                "rms_level": 0.0,
-                "text": None,
-                "status_text": "Ready",
-            })
+            self.ipc.send_frame(IDLE_STATE_FRAME)
@@ -10,6 +10,7 @@ import time
 import numpy as np
 import sounddevice as sd
 
+from .audio_processor import rms
 from .config import get_config
 from .utils import log
 
@@ -17,16 +18,25 @@ from .utils import log
 class Recorder:
     """Microphone audio recorder with thread-safe start/stop."""
 
+    # Captured audio is written into blocks of this many seconds, so the
+    # audio callback allocates once per block instead of once per callback.
+    _CAPTURE_BLOCK_SECONDS = 10
+
     def __init__(self):
         self._recording = threading.Event()
+        self._stopped = threading.Event()
+        self._stopped.set()
         self._input_ready = threading.Event()
         self._chunks = []
-        self._chunks_lock = threading.Lock()
+        self._block: np.ndarray | None = None
+        self._block_fill: int = 0
+        self._block_size: int = 0
         self._input_health_lock = threading.Lock()
         self._stream = None
         self._state_lock = threading.Lock()
         self._monitor_lock = threading.Lock()
-        self._start_time = None
+        self._frames_recorded: int = 0
+        self._sample_rate: int = 0
         self._current_rms: float = 0.0
         self._input_has_signal = False
         self._input_frames_seen = 0
@@ -48,9 +58,13 @@ class Recorder:
 
     @property
     def duration(self) -> float:
-        """Get current recording duration in seconds."""
-        if self._start_time and self._recording.is_set():
-            return time.time() - self._start_time
+        """Get current recording duration in seconds.
+
+        Derived from the frame count the audio callback publishes, so reading
+        it never takes a lock or touches the wall clock.
+        """
+        if self._sample_rate and self._recording.is_set():
+            return self._frames_recorded / self._sample_rate
         return 0.0
 
     @property
@@ -58,6 +72,10 @@ class Recorder:
         """Current audio RMS level (0.0-1.0), updated each callback."""
         return self._current_rms
 
+    def wait_for_stop(self, timeout: float) -> bool:
+        """Block until recording stops or ``timeout`` elapses. True once stopped."""
+        return self._stopped.wait(timeout)
+
     @property
     def last_error_message(self) -> str | None:
         """Most recent start failure, formatted for user-facing surfaces."""
@@ -145,21 +163,25 @@ class Recorder:
         """Fill ring buffer with latest audio."""
         flat = data[:, 0]
         n = len(flat)
-        buf_size = len(self._pre_buffer)
+        buf = self._pre_buffer
+        buf_size = buf.size
         if buf_size == 0:
             return
+        pos = self._pre_buffer_pos
+        end = pos + n
+        # Common case: the block fits before the end of the ring.
+        if end <= buf_size:
+            np.copyto(buf[pos:end], flat)
+            self._pre_buffer_pos = end % buf_size
+            return
         if n >= buf_size:
-            self._pre_buffer[:] = flat[-buf_size:]
+            np.copyto(buf, flat[-buf_size:])
             self._pre_buffer_pos = 0
-        else:
-            end = self._pre_buffer_pos + n
-            if end <= buf_size:
-                self._pre_buffer[self._pre_buffer_pos:end] = flat
-            else:
-                first = buf_size - self._pre_buffer_pos
-                self._pre_buffer[self._pre_buffer_pos:] = flat[:first]
-                self._pre_buffer[:n - first] = flat[first:]
-            self._pre_buffer_pos = end % buf_size
+            return
+        first = buf_size - pos
+        np.copyto(buf[pos:], flat[:first])
+        np.copyto(buf[:n - first], flat[first:])
+        self._pre_buffer_pos = end - buf_size
 
     def start(self) -> bool:
         """Start recording audio from microphone."""
@@ -169,22 +191,31 @@ class Recorder:
                 return False
             self._last_error_message = None
             self.stop_monitoring()
-            with self._chunks_lock:
-                if config.audio.pre_buffer > 0 and len(self._pre_buffer) > 0:
-                    # Reassemble the ring buffer in one allocation instead of
-                    # np.roll + .copy (which allocates twice).
-                    buf_size = len(self._pre_buffer)
-                    pos = self._pre_buffer_pos
-                    pre = np.empty(buf_size, dtype=np.float32)
-                    pre[:buf_size - pos] = self._pre_buffer[pos:]
-                    pre[buf_size - pos:] = self._pre_buffer[:pos]
-                    self._chunks = [pre]
+            if config.audio.pre_buffer > 0 and len(self._pre_buffer) > 0:
+                # stop_monitoring() above has already stopped the monitor
+                # stream (PortAudio waits out an in-flight callback), so the
+                # ring and its write position can't change under this read.
+                # stop() concatenates the chunks anyway, so hand it the
+                # two halves of the ring in order rather than unrolling
+                # the buffer into a scratch array first. Copies, not
+                # views: a monitor restart would overwrite the ring.
+                buf = self._pre_buffer
+                pos = self._pre_buffer_pos
+                if pos:
+                    self._chunks = [buf[pos:].copy(), buf[:pos].copy()]
                 else:
-                    self._chunks = []
+                    self._chunks = [buf.copy()]
+            else:
+                self._chunks = []
+            self._block = None
+            self._block_fill = 0
+            self._block_size = int(config.audio.sample_rate * self._CAPTURE_BLOCK_SECONDS)
 
             last_error: Exception | None = None
             for attempt in range(1, self._start_retries + 1):
                 self._reset_input_health()
+                self._frames_recorded = 0
+                self._sample_rate = config.audio.sample_rate
                 self._recording.set()
                 try:
                     self._stream = sd.InputStream(
@@ -197,7 +228,7 @@ class Recorder:
                     self._stream.start()
 
                     if self._wait_for_live_input():
-                        self._start_time = time.time()
+                        self._stopped.clear()
                         return True
 
                     last_error = RuntimeError(self.no_signal_error_message())
@@ -209,8 +240,9 @@ class Recorder:
 
                 self._recording.clear()
                 self._silent_close_stream()
-                with self._chunks_lock:
-                    self._chunks = []
+                self._chunks = []
+                self._block = None
+                self._block_fill = 0
                 if attempt < self._start_retries:
                     self.reset_audio_host(close_stream=False)
                     time.sleep(0.5 * attempt)
@@ -267,14 +299,29 @@ class Recorder:
             if not self._recording.is_set():
                 return np.array([], dtype=np.float32)
             self._recording.clear()
+            self._stopped.set()
             self._silent_close_stream()
-            with self._chunks_lock:
-                if self._chunks:
-                    audio = np.concatenate(self._chunks)
-                    self._chunks = []
-                    return audio
-                self._chunks = []
+            chunks, self._chunks = self._chunks, []
+            block, fill = self._block, self._block_fill
+            self._block = None
+            self._block_fill = 0
+            if block is not None and fill:
+                chunks.append(block[:fill])
+            del block
+            if not chunks:
                 return np.array([], dtype=np.float32)
+            if len(chunks) == 1:
+                return chunks[0]
+            # Copy into one preallocated array and drop each block as soon as
+            # it is copied, so a long recording never sits in memory twice
+            # the way it does while np.concatenate builds its result.
+            audio = np.empty(sum(len(c) for c in chunks), dtype=np.float32)
+            pos = 0
+            for i, chunk in enumerate(chunks):
+                audio[pos:pos + len(chunk)] = chunk
+                pos += len(chunk)
+                chunks[i] = None
+            return audio
 
     def reset_audio_host(self, close_stream: bool = True):
         """Reset PortAudio after macOS leaves an input device in a stale state."""
@@ -330,7 +377,7 @@ class Recorder:
     def _callback(self, data, frames, time_info, status):
         """Audio stream callback - accumulate chunks (thread-safe)."""
         flat = data[:, 0]
-        self._current_rms = float(np.sqrt(np.mean(data ** 2)))
+        self._current_rms = rms(flat)
 
         with self._input_health_lock:
             self._input_frames_seen += len(flat)
@@ -339,7 +386,32 @@ class Recorder:
             if self._input_has_signal or self._input_frames_seen >= 512:
                 self._input_ready.set()
 
-        # Check recording flag inside lock to prevent race with stop()
-        with self._chunks_lock:
-            if self._recording.is_set():
-                self._chunks.append(flat.copy())
+        # No lock on the real-time thread: it is the only writer while
+        # recording, list.append is atomic under the GIL, and stop() clears
+        # the flag and closes the stream (which waits out an in-flight
+        # callback) before taking the captured blocks.
+        if self._recording.is_set():
+            self._append_samples(flat)
+            self._frames_recorded += len(flat)
+
+    def _append_samples(self, flat: np.ndarray):
+        """Copy one callback's samples into the current capture block.
+
+        PortAudio reuses ``data`` between callbacks, so the samples must be
+        copied out; a full block is moved to ``_chunks`` and a fresh one
+        started.
+        """
+        n = len(flat)
+        pos = 0
+        while pos < n:
+            block = self._block
+            fill = self._block_fill
+            if block is None or fill == len(block):
+                if block is not None:
+                    self._chunks.append(block)
+                block = self._block = np.empty(max(self._block_size, n - pos), dtype=np.float32)
+                fill = 0
+            take = min(n - pos, len(block) - fill)
+            block[fill:fill + take] = flat[pos:pos + take]
+            self._block_fill = fill + take
+            pos += take
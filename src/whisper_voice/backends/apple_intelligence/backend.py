@@ -10,6 +10,7 @@ import asyncio
 import concurrent.futures
 import gc
 import threading
+import time
 from typing import Optional, Tuple
 
 from ...config import get_config
@@ -23,6 +24,20 @@ try:
 except ImportError:
     _SDK_AVAILABLE = False
 
+# Upper bound for the startup warm-up request; it runs on the init thread.
+_WARMUP_TIMEOUT_SECONDS = 30.0
+
+# How long a positive availability check is trusted. running() is probed on
+# every dictation and shortcut; a failed request drops the cached result.
+_AVAILABLE_TTL_SECONDS = 30.0
+
+# SDK unavailability reasons, matched by substring in priority order.
+_UNAVAILABLE_REASONS: Tuple[Tuple[str, str], ...] = (
+    ("not_enabled", "Apple Intelligence not enabled. Enable in System Settings."),
+    ("not_eligible", "Device not eligible for Apple Intelligence."),
+    ("not_ready", "Apple Intelligence model not ready yet."),
+)
+
 
 class AppleIntelligenceBackend(GrammarBackend):
     """
@@ -43,6 +58,7 @@ class AppleIntelligenceBackend(GrammarBackend):
         # calls are single-flight: a second caller fails fast with a clear
         # message instead of poisoning the session.
         self._request_lock = threading.Lock()
+        self._available_until = 0.0
 
     @property
     def name(self) -> str:
@@ -52,6 +68,7 @@ class AppleIntelligenceBackend(GrammarBackend):
         """Clean up session and stop the background event loop."""
         with self._model_lock:
             self._model = None
+        self._available_until = 0.0
         if self._loop is not None and not self._loop.is_closed():
             self._loop.call_soon_threadsafe(self._loop.stop)
         if self._loop_thread is not None and self._loop_thread.is_alive():
@@ -75,26 +92,27 @@ class AppleIntelligenceBackend(GrammarBackend):
             log(f"apple-fm-sdk not installed. Run: {hint}", "ERR")
             return False
 
+        if time.monotonic() < self._available_until:
+            return True
+
         try:
-            model = fm.SystemLanguageModel()
-            available, reason = model.is_available()
+            available, reason = self._get_model().is_available()
         except Exception as e:
             log(f"Apple Intelligence availability check failed: {e}", "ERR")
             return False
 
         if available:
+            self._available_until = time.monotonic() + _AVAILABLE_TTL_SECONDS
             return True
 
         if reason is not None:
             reason_name = reason.name if hasattr(reason, "name") else str(reason)
-            if "not_enabled" in reason_name.lower() or "not_enabled" in str(reason).lower():
-                log("Apple Intelligence not enabled. Enable in System Settings.", "WARN")
-            elif "not_eligible" in reason_name.lower() or "not_eligible" in str(reason).lower():
-                log("Device not eligible for Apple Intelligence.", "WARN")
-            elif "not_ready" in reason_name.lower() or "not_ready" in str(reason).lower():
-                log("Apple Intelligence model not ready yet.", "WARN")
-            else:
-                log(f"Apple Intelligence unavailable: {reason_name}", "WARN")
+            haystack = f"{reason_name} {reason}".lower()
+            message = next(
+                (msg for key, msg in _UNAVAILABLE_REASONS if key in haystack),
+                f"Apple Intelligence unavailable: {reason_name}",
+            )
+            log(message, "WARN")
 
         return False
 
@@ -103,9 +121,32 @@ class AppleIntelligenceBackend(GrammarBackend):
         if not self.running():
             log("Apple Intelligence not available", "WARN")
             return False
+        if get_config().apple_intelligence.warmup:
+            self._warm_up()
         log("Apple Intelligence ready", "OK")
         return True
 
+    def _warm_up(self) -> None:
+        """Run one tiny request so the first real correction skips the cold load.
+
+        Builds the cached model and the event loop and gets the on-device
+        model resident. Failures are logged only: the backend is available,
+        and a real request will surface any actual problem.
+        """
+        if not self._request_lock.acquire(blocking=False):
+            return
+        try:
+            self._run_async(
+                self._generate("Reply with OK.", "OK"),
+                timeout=_WARMUP_TIMEOUT_SECONDS,
+            )
+        except (TimeoutError, concurrent.futures.TimeoutError):
+            log("Apple Intelligence warm-up timed out", "WARN")
+        except Exception as e:
+            log(f"Apple Intelligence warm-up failed: {self._classify_error(e)}", "WARN")
+        finally:
+            self._request_lock.release()
+
     def fix(self, text: str) -> Tuple[str, Optional[str]]:
         """Fix grammar using Apple Intelligence. Delegates to transcription mode."""
         return self.fix_with_mode(text, "transcription")
@@ -156,6 +197,7 @@ class AppleIntelligenceBackend(GrammarBackend):
             log(f"Apple Intelligence timed out for {mode.name}", "ERR")
             return text, "Timeout"
         except Exception as e:
+            self._available_until = 0.0
             err_msg = self._classify_error(e)
             log(f"Apple Intelligence error for {mode.name}: {err_msg}", "ERR")
             return text, err_msg[:ERROR_TRUNCATE_LENGTH]
@@ -178,6 +220,11 @@ class AppleIntelligenceBackend(GrammarBackend):
 
     def _ensure_loop(self) -> None:
         """Start a persistent background event loop if one isn't running."""
+        # Lock-free fast path: once started, the loop is only replaced by
+        # close(), so a live reference needs no lock to confirm.
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            return
         with self._loop_lock:
             if self._loop is not None and not self._loop.is_closed():
                 return
@@ -202,19 +249,24 @@ class AppleIntelligenceBackend(GrammarBackend):
             future.cancel()
             raise
 
-    async def _generate(self, system_prompt: str, user_prompt: str) -> str:
-        """Create a fresh session per request so transcript history does not grow forever."""
+    def _get_model(self):
+        """Return the cached model, shared by availability checks and requests."""
+        model = self._model
+        if model is not None:
+            return model
         with self._model_lock:
             if self._model is None:
                 self._model = fm.SystemLanguageModel(
                     use_case=fm.SystemLanguageModelUseCase.GENERAL,
                     guardrails=fm.SystemLanguageModelGuardrails.PERMISSIVE_CONTENT_TRANSFORMATIONS,
                 )
-            model = self._model
+            return self._model
 
+    async def _generate(self, system_prompt: str, user_prompt: str) -> str:
+        """Create a fresh session per request so transcript history does not grow forever."""
         session = fm.LanguageModelSession(
             instructions=system_prompt,
-            model=model,
+            model=self._get_model(),
         )
         try:
             return await session.respond(user_prompt)
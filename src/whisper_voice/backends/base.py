@@ -9,12 +9,21 @@ and implement the required methods.
 
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple, Union
 
 # Shared constants
 ERROR_TRUNCATE_LENGTH = 50  # Consistent error message truncation
 DEFAULT_CONNECT_TIMEOUT = 10  # Default connection timeout in seconds
 
+# Chunk boundaries for _split_lossless: newline runs first, then sentence ends.
+# The capturing groups keep the separators so chunks rejoin losslessly.
+_NEWLINE_RUN_SPLIT = re.compile(r'(\n[ \t]*(?:\n[ \t]*)*)')
+_SENTENCE_SPLIT = re.compile(r'((?<=[.!?])[ \t]+)')
+
+# A whole result wrapped in a markdown code fence, for _clean_result.
+_CODE_FENCE = re.compile(r'^```[a-zA-Z]*\s*\n?(.*?)\n?```\s*$', re.DOTALL)
+
 
 class GrammarBackend(ABC):
     """
@@ -24,6 +33,11 @@ class GrammarBackend(ABC):
     that all grammar backends must implement.
     """
 
+    # How many chunks _fix_in_chunks sends at once. Single-flight by default
+    # (Apple FM rejects concurrent requests); HTTP backends raise it and let
+    # the server queue or batch anything beyond its own parallel slots.
+    _CHUNK_WORKERS = 1
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -124,14 +138,14 @@ class GrammarBackend(ABC):
         # Atoms are (piece, following_separator) where separators are the
         # exact whitespace runs removed from between pieces.
         atoms: List[Tuple[str, str]] = []
-        parts = re.split(r'(\n[ \t]*(?:\n[ \t]*)*)', text)
+        parts = _NEWLINE_RUN_SPLIT.split(text)
         for i in range(0, len(parts), 2):
             piece = parts[i]
             sep = parts[i + 1] if i + 1 < len(parts) else ""
             if len(piece) <= max_chars:
                 atoms.append((piece, sep))
                 continue
-            sub = re.split(r'((?<=[.!?])[ \t]+)', piece)
+            sub = _SENTENCE_SPLIT.split(piece)
             sub_atoms: List[Tuple[str, str]] = []
             for j in range(0, len(sub), 2):
                 sp = sub[j]
@@ -148,39 +162,64 @@ class GrammarBackend(ABC):
                 sub_atoms[-1] = (last_piece, last_sep + sep)
             atoms.extend(sub_atoms)
 
-        # Greedy packing that keeps intra-chunk separators verbatim.
+        # Greedy packing that keeps intra-chunk separators verbatim. Sizes
+        # are tracked as lengths and each chunk is joined once on flush,
+        # instead of re-concatenating the growing chunk for every atom.
         chunks: List[Tuple[str, str]] = []
-        current = ""
+        current: List[str] = []
+        current_len = 0
         current_sep = ""
         for piece, sep in atoms:
-            if not current and not current_sep:
-                current, current_sep = piece, sep
+            if not current_len and not current_sep:
+                current, current_len, current_sep = [piece], len(piece), sep
                 continue
-            candidate = current + current_sep + piece
-            if len(candidate) > max_chars:
-                chunks.append((current, current_sep))
-                current, current_sep = piece, sep
+            candidate_len = current_len + len(current_sep) + len(piece)
+            if candidate_len > max_chars:
+                chunks.append(("".join(current), current_sep))
+                current, current_len, current_sep = [piece], len(piece), sep
             else:
-                current, current_sep = candidate, sep
-        chunks.append((current, current_sep))
+                current += (current_sep, piece)
+                current_len, current_sep = candidate_len, sep
+        chunks.append(("".join(current), current_sep))
         return chunks
 
     def _fix_in_chunks(self, text: str, max_chars: int, mode_id: str) -> Tuple[str, Optional[str]]:
-        """Run fix_with_mode over lossless chunks, preserving separators."""
+        """Run fix_with_mode over lossless chunks, preserving separators.
+
+        Up to ``_CHUNK_WORKERS`` chunks are in flight at once; results are
+        reassembled in order and the first error (in chunk order) wins.
+        """
         pieces = self._split_lossless(text, max_chars)
         log_name = self.name
         from ..utils import log
         log(f"{log_name}: splitting {len(text)} chars into {len(pieces)} chunks", "INFO")
+
+        def fix_piece(i: int, chunk: str) -> Tuple[str, Optional[str]]:
+            if not chunk.strip():
+                return chunk, None
+            log(f"{log_name}: processing chunk {i + 1}/{len(pieces)} ({len(chunk)} chars)", "INFO")
+            return self.fix_with_mode(chunk, mode_id)
+
         results: List[str] = []
-        for i, (chunk, sep) in enumerate(pieces):
-            if chunk.strip():
-                log(f"{log_name}: processing chunk {i + 1}/{len(pieces)} ({len(chunk)} chars)", "INFO")
-                fixed, err = self.fix_with_mode(chunk, mode_id)
+        workers = min(self._CHUNK_WORKERS, len(pieces))
+        if workers <= 1:
+            for i, (chunk, sep) in enumerate(pieces):
+                fixed, err = fix_piece(i, chunk)
                 if err:
                     return text, err
-            else:
-                fixed = chunk
-            results.append(fixed + sep)
+                results.append(fixed + sep)
+            return "".join(results), None
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grammar-chunk")
+        try:
+            futures = [pool.submit(fix_piece, i, chunk) for i, (chunk, _) in enumerate(pieces)]
+            for future, (_, sep) in zip(futures, pieces):
+                fixed, err = future.result()
+                if err:
+                    return text, err
+                results.append(fixed + sep)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
         return "".join(results), None
 
     def _normalize_leading_spaces(self, text: str) -> str:
@@ -190,24 +229,29 @@ class GrammarBackend(ABC):
         Some models add a single leading space to each line.
         This removes that artifact while preserving intentional indentation.
         """
-        lines = text.splitlines()
-        non_empty = [line for line in lines if line.strip()]
-
-        if not non_empty:
+        # Visible text at the very start means the first line has no
+        # leading space, so the artifact is absent (the usual case).
+        if not text or not text[0].isspace():
             return text
 
-        # Don't modify if tabs are used (intentional formatting)
-        if any(line.startswith("\t") for line in non_empty):
-            return text
-
-        # If all non-empty lines start with exactly one space, remove it
-        if all(line.startswith(" ") and not line.startswith("  ") for line in non_empty):
-            return "\n".join(
-                line[1:] if line.startswith(" ") else line
-                for line in lines
-            )
+        # Only strip when every non-empty line starts with exactly one
+        # space. A tab- or double-space-indented line is intentional
+        # formatting and ends the scan at once.
+        lines = text.splitlines()
+        seen_content = False
+        for line in lines:
+            if not line.strip():
+                continue
+            if not line.startswith(" ") or line.startswith("  "):
+                return text
+            seen_content = True
 
-        return text
+        if not seen_content:
+            return text
+        return "\n".join(
+            line[1:] if line.startswith(" ") else line
+            for line in lines
+        )
 
     # Label prefixes, e.g. "Corrected:", "Here is the corrected text:"
     _LABEL_PATTERNS = [
@@ -263,32 +307,62 @@ class GrammarBackend(ABC):
         r'\s*please let me know[^.!?\n]*[.!?]?\s*$',
     ]
 
+    # Compiled once at class creation; _clean_result runs on every chunk.
+    _PREFIX_RES = tuple(
+        re.compile(p, re.IGNORECASE) for p in _LABEL_PATTERNS + _OPENER_PATTERNS
+    )
+    _TRAILER_RES = tuple(re.compile(p, re.IGNORECASE) for p in _TRAILER_PATTERNS)
+
+    # Each list fused into one alternation, used only as a pre-check: the
+    # union matches iff some member does, so a clean result costs one scan.
+    # Stripping itself stays per pattern (echo guard, order, fixpoint).
+    _PREFIX_ANY = re.compile(
+        "|".join(f"(?:{p})" for p in _LABEL_PATTERNS + _OPENER_PATTERNS), re.IGNORECASE
+    )
+    _TRAILER_ANY = re.compile("|".join(f"(?:{p})" for p in _TRAILER_PATTERNS), re.IGNORECASE)
+
+    @staticmethod
+    def _closing_segment(text: str) -> str:
+        """Return the end of ``text`` after its last ``.``/``!``/``?``/newline.
+
+        One closing mark and trailing whitespace are ignored first. Every
+        trailer pattern is anchored to the end and cannot span those
+        characters, so any trailer match lies inside this segment and the
+        fused pre-check need not scan the whole response.
+        """
+        tail = text.rstrip()
+        if tail[-1:] in (".", "!", "?"):
+            tail = tail[:-1]
+        cut = max(tail.rfind("."), tail.rfind("!"), tail.rfind("?"), tail.rfind("\n"))
+        return tail[cut + 1:]
+
     @staticmethod
-    def _echoes_input_prefix(matched: str, original: Optional[str]) -> bool:
+    def _echoes_input_prefix(matched: str, original_key: Optional[str]) -> bool:
         """True when the matched artifact is really the user's own text.
 
         A proofread result closely echoes its input, so any prefix the model
         'added' that ALSO starts the input text (e.g. a sentence that begins
         with "Sure, ..." or "Result: ...") is legitimate content — stripping
         it would corrupt the user's text before it gets pasted back over
-        their selection.
+        their selection. ``original_key`` is the input already stripped and
+        lowercased, so the cleaning loop normalizes it once.
         """
-        if original is None:
+        if original_key is None:
             return False
         fragment = matched.strip().lower()
         if not fragment:
             return False
-        return original.strip().lower().startswith(fragment)
+        return original_key.startswith(fragment)
 
     @staticmethod
-    def _echoes_input_suffix(matched: str, original: Optional[str]) -> bool:
+    def _echoes_input_suffix(matched: str, original_key: Optional[str]) -> bool:
         """Suffix twin of _echoes_input_prefix."""
-        if original is None:
+        if original_key is None:
             return False
         fragment = matched.strip().lower()
         if not fragment:
             return False
-        return original.strip().lower().endswith(fragment)
+        return original_key.endswith(fragment)
 
     def _clean_result(self, result: str, original: Optional[str] = None) -> str:
         """
@@ -301,6 +375,8 @@ class GrammarBackend(ABC):
         own "Sure, sounds good." must survive cleaning intact.
         """
         result = result.strip()
+        original_stripped = (original or "").strip()
+        original_key = original_stripped.lower() if original is not None else None
 
         # Strip symmetric wrapping quotes only when the input wasn't quoted.
         for quote in ('"', "'"):
@@ -308,8 +384,8 @@ class GrammarBackend(ABC):
                 len(result) >= 2
                 and result.startswith(quote)
                 and result.endswith(quote)
-                and not (original or "").strip().startswith(quote)
-                and not (original or "").strip().endswith(quote)
+                and not original_stripped.startswith(quote)
+                and not original_stripped.endswith(quote)
             ):
                 result = result[1:-1].strip()
 
@@ -318,20 +394,23 @@ class GrammarBackend(ABC):
         # "artifact" IS the entire text, it's the content.
         for _ in range(3):
             before = result
-            for pattern in self._LABEL_PATTERNS + self._OPENER_PATTERNS:
-                m = re.match(pattern, result, flags=re.IGNORECASE)
+            prefixes = self._PREFIX_RES if self._PREFIX_ANY.match(result) else ()
+            for pattern in prefixes:
+                m = pattern.match(result)
                 if not m or not m.group(0):
                     continue
-                if self._echoes_input_prefix(m.group(0), original):
+                if self._echoes_input_prefix(m.group(0), original_key):
                     continue
                 candidate = result[m.end():]
                 if candidate.strip():
                     result = candidate
-            for pattern in self._TRAILER_PATTERNS:
-                m = re.search(pattern, result, flags=re.IGNORECASE)
+            closing = self._closing_segment(result)
+            trailers = self._TRAILER_RES if self._TRAILER_ANY.search(closing) else ()
+            for pattern in trailers:
+                m = pattern.search(result)
                 if not m or not m.group(0):
                     continue
-                if self._echoes_input_suffix(m.group(0), original):
+                if self._echoes_input_suffix(m.group(0), original_key):
                     continue
                 candidate = result[:m.start()]
                 if candidate.strip():
@@ -341,12 +420,8 @@ class GrammarBackend(ABC):
 
         # Unwrap a markdown code fence the model added — but never one the
         # user's own text started with.
-        if not (original or "").lstrip().startswith("```"):
-            code_block_match = re.match(
-                r'^```[a-zA-Z]*\s*\n?(.*?)\n?```\s*$',
-                result,
-                re.DOTALL,
-            )
+        if not original_stripped.startswith("```"):
+            code_block_match = _CODE_FENCE.match(result)
             if code_block_match:
                 result = code_block_match.group(1).strip()
 
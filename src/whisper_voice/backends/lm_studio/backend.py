@@ -21,6 +21,8 @@ from ..modes import get_mode, get_mode_lm_studio_messages
 class LMStudioBackend(GrammarBackend):
     """Grammar correction backend using LM Studio's OpenAI-compatible API."""
 
+    _CHUNK_WORKERS = 4
+
     def __init__(self):
         self._session = requests.Session()
 
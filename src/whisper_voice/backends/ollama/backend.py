@@ -21,6 +21,8 @@ from ..modes import get_mode, get_mode_ollama_prompt
 class OllamaBackend(GrammarBackend):
     """Grammar correction backend using local Ollama server."""
 
+    _CHUNK_WORKERS = 4
+
     def __init__(self):
         self._session = requests.Session()
 
@@ -47,6 +47,23 @@ def _has_free_space(path: Path, required_bytes: int = _MIN_FREE_BYTES) -> bool:
     return False
 
 
+def _to_pcm16(data: np.ndarray) -> np.ndarray:
+    """Sanitize float audio and convert to int16 PCM with one scratch buffer."""
+    safe = np.nan_to_num(data, nan=0.0, posinf=0.0, neginf=0.0)
+    np.clip(safe, -1.0, 1.0, out=safe)
+    safe *= 32767
+    return safe.astype(np.int16)
+
+
+def _write_wav(path: Path, pcm: np.ndarray, sample_rate: int):
+    """Write mono int16 PCM. The array goes to writeframes as a buffer, no tobytes() copy."""
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm)
+
+
 class Backup:
     """Manages backup of audio files and transcription text."""
 
@@ -131,30 +148,19 @@ class Backup:
                 pass
         with self._lock:
             try:
-                safe = np.nan_to_num(data, nan=0.0, posinf=0.0, neginf=0.0)
-                safe = np.clip(safe, -1.0, 1.0)
-                audio_int16 = (safe * 32767).astype(np.int16)
-                audio_bytes = audio_int16.tobytes()
-
                 # Write to the canonical last_recording.wav (for retry)
-                with wave.open(str(self.audio_path), 'wb') as w:
-                    w.setnchannels(1)
-                    w.setsampwidth(2)
-                    w.setframerate(config.audio.sample_rate)
-                    w.writeframes(audio_bytes)
+                _write_wav(self.audio_path, _to_pcm16(data), config.audio.sample_rate)
 
                 # Also write a timestamped copy to audio_history/. The stem
                 # is remembered so save_history() names this session's text
                 # entry identically — that shared stem is what associates a
-                # transcription with its recording in the UI.
+                # transcription with its recording in the UI. copyfile lets
+                # the kernel copy the finished file (fcopyfile on macOS)
+                # instead of encoding and writing the audio a second time.
                 try:
                     ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
                     history_path = self._audio_history_dir / f"{ts}.wav"
-                    with wave.open(str(history_path), 'wb') as w:
-                        w.setnchannels(1)
-                        w.setsampwidth(2)
-                        w.setframerate(config.audio.sample_rate)
-                        w.writeframes(audio_bytes)
+                    shutil.copyfile(self.audio_path, history_path)
                     self._session_stem = ts
                     self._prune_audio_history()
                 except Exception as e:
@@ -234,14 +240,7 @@ class Backup:
         config = get_config()
         with self._lock:
             try:
-                safe = np.nan_to_num(data, nan=0.0, posinf=0.0, neginf=0.0)
-                safe = np.clip(safe, -1.0, 1.0)
-                audio = (safe * 32767).astype(np.int16)
-                with wave.open(str(self.processed_audio_path), 'wb') as w:
-                    w.setnchannels(1)
-                    w.setsampwidth(2)
-                    w.setframerate(config.audio.sample_rate)
-                    w.writeframes(audio.tobytes())
+                _write_wav(self.processed_audio_path, _to_pcm16(data), config.audio.sample_rate)
                 return self.processed_audio_path
             except Exception as e:
                 log(f"Save processed audio failed: {e}", "ERR")
@@ -255,14 +254,7 @@ class Backup:
         path = self._dir / f"last_recording_{index}.wav"
         with self._lock:
             try:
-                safe = np.nan_to_num(data, nan=0.0, posinf=0.0, neginf=0.0)
-                safe = np.clip(safe, -1.0, 1.0)
-                audio = (safe * 32767).astype(np.int16)
-                with wave.open(str(path), 'wb') as w:
-                    w.setnchannels(1)
-                    w.setsampwidth(2)
-                    w.setframerate(config.audio.sample_rate)
-                    w.writeframes(audio.tobytes())
+                _write_wav(path, _to_pcm16(data), config.audio.sample_rate)
                 return path
             except Exception as e:
                 log(f"Save segment failed: {e}", "ERR")
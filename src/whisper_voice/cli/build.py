@@ -92,9 +92,11 @@ def _build_local_whisper_ui(swift: str) -> bool:
         return False
 
     print(f"{C_DIM}Building LocalWhisperUI...{C_RESET}")
+    # --package-path instead of cwd= and close_fds=False keep this launch on
+    # subprocess's posix_spawn path (see doctor._run_update_step).
     result = subprocess.run(
-        [swift, "build", "-c", "release"],
-        cwd=str(ui_dir),
+        [swift, "build", "-c", "release", "--package-path", str(ui_dir)],
+        close_fds=False,
     )
     if result.returncode != 0:
         print(f"{C_RED}LocalWhisperUI build failed{C_RESET}", file=sys.stderr)
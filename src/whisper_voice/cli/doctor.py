@@ -35,6 +35,17 @@ FORMULA_NAME = "gabrimatic/local-whisper/local-whisper"
 MODEL_PREP_TIMEOUT_SECONDS = 180
 
 
+def _run_update_step(cmd: list, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run for update steps, eligible for CPython's posix_spawn path.
+
+    The update runs inside the service, which may have a model resident, and
+    fork() has to copy those page tables before exec. subprocess only uses
+    posix_spawn when close_fds is False (and there is no cwd/preexec_fn);
+    Python's own fds are non-inheritable by default, so nothing leaks.
+    """
+    return subprocess.run(cmd, close_fds=False, **kwargs)
+
+
 def _doctor_pass(msg: str):
     print(f"  {C_GREEN}✓{C_RESET}  {msg}")
 
@@ -643,14 +654,14 @@ def cmd_update(
         if not brew:
             return fail("Update failed: Homebrew not found")
         brew_env = _homebrew_update_env()
-        result = subprocess.run([brew, "update"], capture_output=True, text=True, env=brew_env)
+        result = _run_update_step([brew, "update"], capture_output=True, text=True, env=brew_env)
         if result.returncode != 0:
             return fail("Update failed: Homebrew refresh failed", result.stderr or result.stdout)
         print(f"  {C_GREEN}Done{C_RESET}")
 
         print(f"\n  {C_BOLD}2/4  Upgrading Local Whisper...{C_RESET}")
         report("processing", "Updating: installing app update...")
-        result = subprocess.run([brew, "upgrade", FORMULA_NAME], capture_output=True, text=True, env=brew_env)
+        result = _run_update_step([brew, "upgrade", FORMULA_NAME], capture_output=True, text=True, env=brew_env)
         if result.returncode != 0:
             return fail("Update failed: Homebrew upgrade failed", result.stderr or result.stdout)
         print(f"  {C_GREEN}Done{C_RESET}")
@@ -658,13 +669,13 @@ def cmd_update(
         print(f"\n  {C_BOLD}3/4  Preparing active model...{C_RESET}")
         report("processing", "Updating: preparing active model...")
         updated_wh = _homebrew_wh_binary(brew)
-        result = subprocess.run([updated_wh, "_prepare_models"], env=brew_env)
+        result = _run_update_step([updated_wh, "_prepare_models"], env=brew_env)
         if result.returncode != 0:
             return fail("Update failed: active model could not be prepared")
 
         print(f"\n  {C_BOLD}4/4  Restarting service...{C_RESET}")
         report("processing", "Updating: restarting service...")
-        result = subprocess.run(
+        result = _run_update_step(
             [brew, "services", "restart", FORMULA_NAME],
             capture_output=True,
             text=True,
@@ -693,15 +704,16 @@ def cmd_update(
             pre_pull_sha = subprocess.check_output(
                 [git, "-C", str(project_root), "rev-parse", "HEAD"],
                 text=True,
+                close_fds=False,
             ).strip()
         except Exception:
             pre_pull_sha = None
-        fetch_result = subprocess.run(
+        fetch_result = _run_update_step(
             [git, "-C", str(project_root), "fetch", "--prune", "origin"],
         )
         if fetch_result.returncode != 0:
             return fail("Update failed: git fetch failed")
-        branch_result = subprocess.run(
+        branch_result = _run_update_step(
             [git, "-C", str(project_root), "symbolic-ref", "--short", "HEAD"],
             capture_output=True,
             text=True,
@@ -710,7 +722,7 @@ def cmd_update(
         pull_cmd = [git, "-C", str(project_root), "pull", "--ff-only"]
         if branch == "main":
             pull_cmd.extend(["origin", "main"])
-        result = subprocess.run(pull_cmd)
+        result = _run_update_step(pull_cmd)
         if result.returncode != 0:
             print(f"{C_RED}  git pull failed. Aborting update so the service stays on known-good code.{C_RESET}", file=sys.stderr)
             print(f"  {C_DIM}Resolve the issue (conflicts, auth, or network) and rerun: wh update{C_RESET}", file=sys.stderr)
@@ -724,7 +736,7 @@ def cmd_update(
     # Step 2: pip install -e . --upgrade
     print(f"\n  {C_BOLD}2/5  Updating Python dependencies...{C_RESET}")
     report("processing", "Updating: installing dependencies...")
-    result = subprocess.run(
+    result = _run_update_step(
         [python, "-m", "pip", "install", "-e", str(project_root), "--upgrade", "--upgrade-strategy", "eager"],
     )
     if result.returncode != 0:
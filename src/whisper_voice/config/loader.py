@@ -219,6 +219,7 @@ def _validate_config(config: Config):
         ("dictation", config.dictation, "enabled"),
         ("dictation", config.dictation, "strip_fillers"),
         ("qwen3_asr", config.qwen3_asr, "use_vocabulary"),
+        ("apple_intelligence", config.apple_intelligence, "warmup"),
     ):
         value = getattr(obj, flag)
         if not isinstance(value, bool):
@@ -407,6 +408,7 @@ def load_config() -> Config:
         config.apple_intelligence = AppleIntelligenceConfig(
             max_chars=data['apple_intelligence'].get('max_chars', config.apple_intelligence.max_chars),
             timeout=data['apple_intelligence'].get('timeout', config.apple_intelligence.timeout),
+            warmup=data['apple_intelligence'].get('warmup', config.apple_intelligence.warmup),
         )
 
     # LM Studio settings
@@ -183,6 +183,9 @@ max_chars = 0
 # Grammar correction timeout in seconds (0 = no limit)
 timeout = 0
 
+# Send a tiny request at startup so the first real correction is not cold
+warmup = true
+
 [lm_studio]
 # LM Studio server URL (OpenAI-compatible endpoint)
 url = "http://localhost:1234/v1/chat/completions"
@@ -428,6 +431,7 @@ class AppleIntelligenceConfig:
     """Apple Intelligence-specific grammar settings."""
     max_chars: int = 0
     timeout: int = 0
+    warmup: bool = True
 
 
 @dataclass
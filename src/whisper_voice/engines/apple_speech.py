@@ -50,6 +50,9 @@ class AppleSpeechEngine(TranscriptionEngine):
 
     def __init__(self, helper_path: Path | None = None):
         self._helper_path = helper_path
+        # Installed helper found by the candidate search, kept so each
+        # transcription re-checks one path instead of walking the list.
+        self._found_helper: Optional[Path] = None
         self._ready = False
         self.last_error = ""
 
@@ -64,7 +67,9 @@ class AppleSpeechEngine(TranscriptionEngine):
     def _resolved_helper(self) -> Optional[Path]:
         if self._helper_path is not None:
             return self._helper_path if self._helper_path.is_file() else None
-        return find_apple_speech_helper()
+        if self._found_helper is None or not self._found_helper.is_file():
+            self._found_helper = find_apple_speech_helper()
+        return self._found_helper
 
     def _run_helper(self, command: str, path: Path | None = None) -> dict[str, Any]:
         helper = self._resolved_helper()
@@ -78,12 +83,17 @@ class AppleSpeechEngine(TranscriptionEngine):
             args.append(str(path))
         timeout = cfg.timeout if cfg.timeout > 0 else None
         try:
+            # Bytes, not text: json.loads takes the UTF-8 payload directly and
+            # stderr is only decoded when a failure message needs it.
+            # close_fds=False lets subprocess use posix_spawn instead of
+            # fork()ing a service that may hold other models in memory;
+            # Python's own fds are non-inheritable by default.
             result = subprocess.run(
                 args,
                 capture_output=True,
-                text=True,
                 timeout=timeout,
                 check=False,
+                close_fds=False,
             )
         except subprocess.TimeoutExpired as exc:
             raise RuntimeError(
@@ -91,14 +101,15 @@ class AppleSpeechEngine(TranscriptionEngine):
             ) from exc
         try:
             payload = json.loads(result.stdout)
-        except (TypeError, json.JSONDecodeError) as exc:
+        except (TypeError, UnicodeDecodeError, json.JSONDecodeError) as exc:
             raise RuntimeError(
                 "Apple SpeechTranscriber returned an invalid response."
             ) from exc
         if not isinstance(payload, dict):
             raise RuntimeError("Apple SpeechTranscriber returned an invalid response.")
         if result.returncode != 0 or payload.get("ok") is not True:
-            message = str(payload.get("message") or result.stderr or "Apple SpeechTranscriber failed.")
+            stderr = (result.stderr or b"").decode("utf-8", errors="replace")
+            message = str(payload.get("message") or stderr or "Apple SpeechTranscriber failed.")
             raise RuntimeError(message.strip())
         return payload
 
@@ -136,6 +147,7 @@ class AppleSpeechEngine(TranscriptionEngine):
 
     def close(self) -> None:
         self._ready = False
+        self._found_helper = None
 
     def release(self) -> bool:
         """Release this app's Apple-managed locale reservation."""
@@ -7,6 +7,7 @@ Accepts one Swift client at a time. All messages are newline-delimited JSON.
 """
 
 import json
+import math
 import os
 import select
 import socket
@@ -21,7 +22,33 @@ from .utils import log
 SOCKET_PATH = str(Path.home() / ".whisper" / "ipc.sock")
 _SEND_READY_TIMEOUT = 2.0
 _SEND_TOTAL_TIMEOUT = 5.0
-_SEND_LOCK_ACQUIRE_TIMEOUT = 0.5
+
+# Recording ticks are the only high-frequency message and differ only in two
+# floats. %a formats a float exactly as json.dumps does (float.__repr__), so
+# the frame is byte-identical to the dict path without building or encoding
+# a dict per tick.
+_RECORDING_TICK_TEMPLATE = (
+    b'{"type": "state_update", "phase": "recording", "duration_seconds": %a, '
+    b'"rms_level": %a, "text": null, "status_text": "Recording..."}\n'
+)
+
+
+# Sent after every copy, paste, error and cancel; the payload never changes.
+IDLE_STATE_FRAME = (
+    b'{"type": "state_update", "phase": "idle", "duration_seconds": 0.0, '
+    b'"rms_level": 0.0, "text": null, "status_text": "Ready"}\n'
+)
+
+
+def _finite(value: float) -> float:
+    # %a would emit nan/inf, which is not JSON and fails the Swift decoder.
+    value = float(value)
+    return value if math.isfinite(value) else 0.0
+
+
+def recording_tick_frame(duration_seconds: float, rms_level: float) -> bytes:
+    """Encoded recording state_update, ready for :meth:`IPCServer.send_frame`."""
+    return _RECORDING_TICK_TEMPLATE % (_finite(duration_seconds), _finite(rms_level))
 
 
 class IPCServer:
@@ -41,6 +68,12 @@ class IPCServer:
         # stale value. Long-running handlers spawn their own threads inside
         # _handle_ipc_message, so serial dispatch stays responsive.
         self._dispatch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ipc-dispatch")
+        # Single-slot "latest state" register drained by one writer thread:
+        # producers never wait on the socket, and a burst of state_updates
+        # collapses to the newest one instead of queueing stale ticks.
+        self._latest_state = None
+        self._latest_state_lock = threading.Lock()
+        self._state_pending = threading.Event()
 
     def set_message_handler(self, callback: Callable[[dict], None]):
         """Register handler for incoming messages from the Swift client."""
@@ -53,24 +86,61 @@ class IPCServer:
     def send(self, msg: dict):
         """Thread-safe send. Drops the client on timeout or failure.
 
-        State updates are snapshots, not a log — if another thread is already
-        writing, we drop rather than queue. Everything else (config_snapshot,
-        tester results, download progress) is meaningful exactly once, so
-        those block briefly for the lock instead: a dropped config_snapshot
-        left the UI permanently stale. Writes themselves stay non-blocking
-        with a total-time cap so a stalled consumer can never freeze callers.
+        State updates are snapshots, not a log: they go to the latest-state
+        slot and the writer thread sends whichever is newest when the socket
+        frees up, so callers never block and the UI never replays stale
+        ticks. Everything else (config_snapshot, tester results, download
+        progress) is meaningful exactly once, so it is written directly,
+        blocking briefly for the lock: a dropped config_snapshot left the UI
+        permanently stale. Writes themselves stay non-blocking with a
+        total-time cap so a stalled consumer can never freeze callers.
         """
         if msg.get("type") == "state_update":
-            if not self._send_lock.acquire(timeout=_SEND_LOCK_ACQUIRE_TIMEOUT):
-                return
+            self._post_state(msg)
         else:
-            self._send_lock.acquire()
+            self._send(msg, flush_state=True)
+
+    def send_frame(self, frame: bytes):
+        """Post an already-encoded state_update frame (see :meth:`send`)."""
+        self._post_state(frame)
+
+    def _post_state(self, payload):
+        with self._latest_state_lock:
+            self._latest_state = payload
+        self._state_pending.set()
+
+    def _drain_state_updates(self):
+        """Writer thread: send the newest posted state until the server stops."""
+        while self._running:
+            self._state_pending.wait()
+            self._state_pending.clear()
+            # The slot is emptied only under the send lock (inside _send).
+            # Taking it first would let a direct send() win the lock, find
+            # the slot empty, and go out ahead of the older state.
+            self._send(None, flush_state=True)
+
+    def _send(self, payload, *, flush_state: bool = False):
+        """Write ``payload`` (None for state only) under the send lock.
+
+        With ``flush_state``, a pending state is written first: a state posted
+        before this message must not arrive after it (e.g. "done" before the
+        history_update that follows it).
+        """
+        self._send_lock.acquire()
         try:
+            pending = None
+            if flush_state:
+                with self._latest_state_lock:
+                    pending, self._latest_state = self._latest_state, None
             with self._client_lock:
                 client = self._client
             if client is None:
                 return
-            data = (json.dumps(msg) + "\n").encode("utf-8")
+            data = self._encode(payload) if payload is not None else b""
+            if pending is not None:
+                data = self._encode(pending) + data
+            if not data:
+                return
             try:
                 self._write_with_timeout(client, data)
             except Exception as e:
@@ -85,6 +155,12 @@ class IPCServer:
         finally:
             self._send_lock.release()
 
+    @staticmethod
+    def _encode(payload) -> bytes:
+        if isinstance(payload, bytes):
+            return payload
+        return (json.dumps(payload) + "\n").encode("utf-8")
+
     def _write_with_timeout(self, client: socket.socket, data: bytes):
         """Non-blocking chunked write. Raises TimeoutError past the total cap.
 
@@ -105,10 +181,11 @@ class IPCServer:
                     raise ConnectionError("socket closed mid-send")
                 sent += n
             except BlockingIOError:
-                _, writable, _ = select.select(
-                    [], [client], [], min(_SEND_READY_TIMEOUT, remaining)
-                )
-                if not writable:
+                # poll, not select: select() rejects fds above FD_SETSIZE
+                # (1024), which a long-running service can reach.
+                poller = select.poll()
+                poller.register(client, select.POLLOUT)
+                if not poller.poll(min(_SEND_READY_TIMEOUT, remaining) * 1000):
                     raise TimeoutError("Swift client not draining")
 
     def start(self):
@@ -116,10 +193,14 @@ class IPCServer:
         self._running = True
         t = threading.Thread(target=self._serve, daemon=True)
         t.start()
+        threading.Thread(
+            target=self._drain_state_updates, daemon=True, name="ipc-state-writer"
+        ).start()
 
     def stop(self):
         """Stop the server and close all connections."""
         self._running = False
+        self._state_pending.set()
         self._dispatch_pool.shutdown(wait=False)
         with self._client_lock:
             if self._client is not None:
@@ -196,21 +277,27 @@ class IPCServer:
 
     def _read_loop(self, client: socket.socket):
         """Read newline-delimited JSON messages from client until disconnect."""
-        buf = b""
+        # One receive buffer for the connection's lifetime; pending bytes
+        # accumulate in a bytearray and consumed lines are dropped once per
+        # recv instead of re-splitting the remainder for every line.
+        chunk = bytearray(4096)
+        chunk_view = memoryview(chunk)
+        buf = bytearray()
         while self._running:
             try:
-                chunk = client.recv(4096)
+                n = client.recv_into(chunk)
             except Exception:
                 break
-            if not chunk:
+            if not n:
                 break
-            buf += chunk
+            buf += chunk_view[:n]
             if len(buf) > self._MAX_BUF_SIZE:
                 log("IPC buffer overflow, closing connection", "WARN")
                 break
-            while b"\n" in buf:
-                line, buf = buf.split(b"\n", 1)
-                line = line.strip()
+            start = 0
+            while (end := buf.find(b"\n", start)) != -1:
+                line = buf[start:end].strip()
+                start = end + 1
                 if not line:
                     continue
                 try:
@@ -225,6 +312,7 @@ class IPCServer:
                         pass  # pool shut down, drop message silently
                     except Exception as e:
                         log(f"IPC handler error: {e}", "WARN")
+            del buf[:start]
         try:
             client.close()
         except Exception:
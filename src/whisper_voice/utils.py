@@ -8,6 +8,7 @@ Includes logging, sound playback, and helper functions.
 
 import re
 import subprocess
+import sys
 import threading
 from datetime import datetime
 
@@ -61,6 +62,36 @@ HALLUCINATION_PATTERNS = [
     "[applause]",
 ]
 
+# Compiled once at import: any-pattern search for the per-line and
+# whole-text prefilters, and the per-pattern trailing-suffix strippers
+# (kept separate and ordered, since each strip can expose the next suffix).
+_HALLUCINATION_ANY_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(HALLUCINATION_PATTERNS, key=len, reverse=True))
+)
+_HALLUCINATION_TAIL_RES = tuple(
+    (
+        pattern,
+        re.compile(
+            rf"(?:\s*[-]*\s*)?(?:\.{{3,}}|\.\s*)?\s*{re.escape(pattern)}(?:\.{{3,}}|\.\s*)?\s*$",
+            re.IGNORECASE,
+        ),
+    )
+    for pattern in HALLUCINATION_PATTERNS
+)
+_WORD_RE = re.compile(r"[a-z0-9']+|[а-я0-9']+")
+
+
+def _is_hallucination_line(lower: str) -> bool:
+    """True when a lowercased, stripped line is short enough around a pattern to drop."""
+    if _HALLUCINATION_ANY_RE.search(lower) is None:
+        return False
+    if len(lower) <= 80:
+        return True
+    return any(
+        pattern in lower and len(lower) <= len(pattern) * 4
+        for pattern in HALLUCINATION_PATTERNS
+    )
+
 
 def log(msg: str, level: str = "INFO"):
     """Print a timestamped, colored log message."""
@@ -90,35 +121,26 @@ def strip_hallucination_lines(text: str) -> tuple[str, bool]:
     if not text:
         return text, False
     lines = text.splitlines()
+    if _HALLUCINATION_ANY_RE.search(text.lower()) is None:
+        return "\n".join(lines).strip(), False
     kept = []
     removed = False
     for line in lines:
         line_stripped = line.strip()
-        if not line_stripped:
-            kept.append(line)
-            continue
-        lower = line_stripped.lower()
-        drop = False
-        for pattern in HALLUCINATION_PATTERNS:
-            if pattern in lower:
-                if len(lower) <= max(80, len(pattern) * 4):
-                    drop = True
-                    break
-        if drop:
+        if line_stripped and _is_hallucination_line(line_stripped.lower()):
             removed = True
             continue
         kept.append(line)
     cleaned = "\n".join(kept).strip()
-    for pattern in HALLUCINATION_PATTERNS:
-        cleaned_next = re.sub(
-            rf"(?:\s*[-]*\s*)?(?:\.{{3,}}|\.\s*)?\s*{re.escape(pattern)}(?:\.{{3,}}|\.\s*)?\s*$",
-            "",
-            cleaned,
-            flags=re.IGNORECASE,
-        ).strip()
+    lowered = cleaned.lower()
+    for pattern, tail_re in _HALLUCINATION_TAIL_RES:
+        if pattern not in lowered:
+            continue
+        cleaned_next = tail_re.sub("", cleaned).strip()
         if cleaned_next != cleaned:
             removed = True
             cleaned = cleaned_next
+            lowered = cleaned.lower()
     return cleaned, removed
 
 
@@ -132,9 +154,11 @@ def is_hallucination(text: str) -> bool:
     lower = cleaned.lower().strip() if cleaned else ""
     if not lower:
         return True
+    if _HALLUCINATION_ANY_RE.search(lower) is None:
+        return False
     for pattern in HALLUCINATION_PATTERNS:
         if pattern in lower:
-            words = re.findall(r"[a-z0-9']+|[а-я0-9']+", lower)
+            words = _WORD_RE.findall(lower)
             if len(lower) <= max(80, len(pattern) * 4) and len(words) <= 6:
                 return True
     return False
@@ -266,6 +290,31 @@ def time_ago(dt: datetime) -> str:
     return dt.strftime("%b %-d")
 
 
+# Darwin QoS classes (sys/qos.h). The scheduler steers user-initiated work
+# to performance cores and lets utility work drift to efficiency cores.
+QOS_CLASS_USER_INITIATED = 0x19
+QOS_CLASS_UTILITY = 0x11
+
+_libsystem = None
+
+
+def set_thread_qos(qos_class: int) -> bool:
+    """Tag the calling thread with a macOS QoS class. False when unsupported."""
+    global _libsystem
+    if sys.platform != "darwin":
+        return False
+    try:
+        if _libsystem is None:
+            import ctypes
+            lib = ctypes.CDLL("/usr/lib/libSystem.dylib")
+            lib.pthread_set_qos_class_self_np.restype = ctypes.c_int
+            lib.pthread_set_qos_class_self_np.argtypes = [ctypes.c_uint, ctypes.c_int]
+            _libsystem = lib
+        return _libsystem.pthread_set_qos_class_self_np(qos_class, 0) == 0
+    except Exception:
+        return False
+
+
 def check_accessibility_trusted() -> bool:
     """Return True if this process has Accessibility permission. False on error."""
     try:
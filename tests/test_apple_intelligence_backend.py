@@ -121,3 +121,61 @@ class TestAppleIntelligenceBackend:
         assert backend._model is None
         assert backend._loop is None
         assert backend._loop_thread is None
+
+    def test_start_warms_up_model_once(self):
+        backend = APPLE_MOD.AppleIntelligenceBackend()
+        cfg = SimpleNamespace(apple_intelligence=SimpleNamespace(max_chars=0, timeout=0, warmup=True))
+
+        with patch.object(APPLE_MOD, "get_config", return_value=cfg):
+            assert backend.start() is True
+            result, err = backend.fix_with_mode("hello there", "transcription")
+        backend.close()
+
+        assert err is None
+        assert result == "resp:" + _FakeLanguageModelSession.instances[-1].prompts[0]
+        warm = _FakeLanguageModelSession.instances[0]
+        assert warm.prompts == ["OK"]
+        assert len(_FakeLanguageModelSession.instances) == 2
+        # The availability probe, warm-up and the real request share one model.
+        assert len(_FakeSystemLanguageModel.instances) == 1
+        assert warm.model is _FakeLanguageModelSession.instances[1].model
+
+    def test_start_skips_warm_up_when_disabled(self):
+        backend = APPLE_MOD.AppleIntelligenceBackend()
+        cfg = SimpleNamespace(apple_intelligence=SimpleNamespace(max_chars=0, timeout=0, warmup=False))
+
+        with patch.object(APPLE_MOD, "get_config", return_value=cfg):
+            assert backend.start() is True
+
+        assert _FakeLanguageModelSession.instances == []
+        assert backend._loop is None
+
+    def test_running_reuses_recent_positive_check(self):
+        backend = APPLE_MOD.AppleIntelligenceBackend()
+        checks = []
+
+        def is_available(model):
+            checks.append(model)
+            return True, _FakeReason()
+
+        with patch.object(_FakeSystemLanguageModel, "is_available", is_available):
+            assert backend.running() is True
+            assert backend.running() is True
+            assert len(checks) == 1
+
+            backend._available_until = 0.0
+            assert backend.running() is True
+            assert len(checks) == 2
+
+        assert len(_FakeSystemLanguageModel.instances) == 1
+
+    def test_running_logs_matching_unavailable_reason(self):
+        backend = APPLE_MOD.AppleIntelligenceBackend()
+        reason = SimpleNamespace(name="MODEL_NOT_READY")
+        logged = []
+
+        with patch.object(_FakeSystemLanguageModel, "is_available", lambda self: (False, reason)), \
+                patch.object(APPLE_MOD, "log", lambda msg, level="INFO": logged.append((msg, level))):
+            assert backend.running() is False
+
+        assert logged == [("Apple Intelligence model not ready yet.", "WARN")]
@@ -30,7 +30,7 @@ def config(monkeypatch):
 
 
 def completed(payload: dict, returncode: int = 0) -> subprocess.CompletedProcess:
-    return subprocess.CompletedProcess([], returncode, json.dumps(payload), "")
+    return subprocess.CompletedProcess([], returncode, json.dumps(payload).encode("utf-8"), b"")
 
 
 def test_start_installs_selected_locale(helper, config, monkeypatch):
@@ -53,6 +53,7 @@ def test_start_installs_selected_locale(helper, config, monkeypatch):
     assert engine.running() is True
     assert calls[0][0] == [str(helper), "install", "--locale", "en-US"]
     assert calls[0][1]["timeout"] is None
+    assert calls[0][1]["close_fds"] is False
 
 
 def test_start_preserves_native_unavailable_message(helper, config, monkeypatch):
@@ -72,6 +73,20 @@ def test_start_preserves_native_unavailable_message(helper, config, monkeypatch)
     assert engine.last_error == "Apple SpeechTranscriber is unavailable on this device."
 
 
+def test_failure_without_message_falls_back_to_stderr(helper, config, monkeypatch):
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(
+            [], 1, json.dumps({"ok": False}).encode("utf-8"), "Locale missing \u2014 de-DE\n".encode("utf-8")
+        ),
+    )
+    engine = AppleSpeechEngine(helper_path=helper)
+
+    assert engine.start() is False
+    assert engine.last_error == "Locale missing \u2014 de-DE"
+
+
 def test_transcribe_returns_native_final_text(helper, config, monkeypatch, tmp_path):
     audio = tmp_path / "speech.wav"
     audio.write_bytes(b"RIFF")
@@ -134,3 +149,30 @@ def test_missing_helper_is_actionable(tmp_path, config):
 
 def test_engine_supports_long_audio(helper, config):
     assert AppleSpeechEngine(helper_path=helper).supports_long_audio is True
+
+
+def test_found_helper_is_cached_until_close(helper, monkeypatch):
+    lookups = []
+
+    def find():
+        lookups.append(1)
+        return helper
+
+    monkeypatch.setitem(
+        AppleSpeechEngine._resolved_helper.__globals__, "find_apple_speech_helper", find
+    )
+    engine = AppleSpeechEngine()
+
+    assert engine._resolved_helper() == helper
+    assert engine._resolved_helper() == helper
+    assert len(lookups) == 1
+
+    engine.close()
+    assert engine._resolved_helper() == helper
+    assert len(lookups) == 2
+
+    helper.unlink()
+    monkeypatch.setitem(
+        AppleSpeechEngine._resolved_helper.__globals__, "find_apple_speech_helper", lambda: None
+    )
+    assert engine._resolved_helper() is None
@@ -35,6 +35,50 @@ class TestRecorderMemory:
         assert np.allclose(audio, np.array([0.1, 0.2, 0.3], dtype=np.float32))
         assert recorder._chunks == []
 
+    def test_duration_follows_callback_frames_and_stop_wakes_waiters(self):
+        fake_sd = SimpleNamespace(InputStream=Mock())
+        with patch.dict("sys.modules", {"sounddevice": fake_sd}):
+            import whisper_voice.audio as audio_mod
+
+        with patch.object(audio_mod, "get_config", return_value=_fake_config()):
+            recorder = audio_mod.Recorder()
+
+        recorder._sample_rate = 16000
+        recorder._recording.set()
+        recorder._stopped.clear()
+        recorder._callback(np.full((8000, 1), 0.01, dtype=np.float32), 8000, None, None)
+
+        assert recorder.duration == 0.5
+        assert recorder.wait_for_stop(0.0) is False
+
+        recorder.stop()
+
+        assert recorder.duration == 0.0
+        assert recorder.wait_for_stop(0.0) is True
+
+    def test_callbacks_fill_capture_blocks_in_order(self):
+        fake_sd = SimpleNamespace(InputStream=Mock())
+        with patch.dict("sys.modules", {"sounddevice": fake_sd}):
+            import whisper_voice.audio as audio_mod
+
+        with patch.object(audio_mod, "get_config", return_value=_fake_config()):
+            recorder = audio_mod.Recorder()
+
+        recorder._block_size = 1000
+        recorder._recording.set()
+        samples = np.arange(2500, dtype=np.float32)
+        for start in range(0, len(samples), 300):
+            block = samples[start:start + 300]
+            recorder._callback(block.reshape(-1, 1), len(block), None, None)
+
+        assert len(recorder._chunks) == 2
+
+        audio = recorder.stop()
+
+        assert np.array_equal(audio, samples)
+        assert recorder._chunks == []
+        assert recorder._block is None
+
     def test_start_retries_after_dead_zero_input(self):
         streams = []
 
@@ -258,6 +258,89 @@ class TestProcessedAudioFields:
         assert 0.0 <= result.peak_level <= 1.0
 
 
+    def test_abs_peak_matches_abs_max(self, proc):
+        from whisper_voice.audio_processor import abs_peak
+
+        audio = np.array([0.1, -0.7, 0.4], dtype=np.float32)
+        assert abs_peak(audio) == pytest.approx(0.7)
+        assert abs_peak(-audio) == pytest.approx(0.7)
+        assert abs_peak(np.array([], dtype=np.float32)) == 0.0
+
+    def test_rms_matches_mean_square(self, proc):
+        from whisper_voice.audio_processor import rms
+
+        audio = np.array([[0.1], [-0.7], [0.4]], dtype=np.float32)
+        expected = float(np.sqrt(np.mean(audio ** 2)))
+        assert rms(audio) == pytest.approx(expected, rel=1e-6)
+        assert rms(audio[:, 0]) == pytest.approx(expected, rel=1e-6)
+        assert rms(np.array([], dtype=np.float32)) == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Noise reduction
+# ---------------------------------------------------------------------------
+
+class TestNoiseReduction:
+    def test_speech_regions_keep_level_and_gaps_pass_through(self, proc):
+        rng = np.random.default_rng(0)
+        noise = (rng.standard_normal(SAMPLE_RATE * 3) * 0.0003).astype(np.float32)
+        audio = noise.copy()
+        speech = (SAMPLE_RATE, 2 * SAMPLE_RATE)
+        audio[speech[0]:speech[1]] += _sine(1.0)
+
+        out = proc._reduce_noise_single(audio, [speech], SAMPLE_RATE)
+
+        assert out.dtype == np.float32
+        assert len(out) == len(audio)
+        inner = slice(speech[0] + 1024, speech[1] - 1024)
+        assert np.allclose(out[inner], audio[inner], atol=1e-3)
+        gap = slice(0, speech[0] - 512)
+        assert np.array_equal(out[gap], audio[gap])
+
+    def test_loud_tone_inside_a_gap_survives(self, proc):
+        rng = np.random.default_rng(1)
+        audio = (rng.standard_normal(SAMPLE_RATE * 4) * 0.0003).astype(np.float32)
+        speech = (SAMPLE_RATE, 2 * SAMPLE_RATE)
+        audio[speech[0]:speech[1]] += _sine(1.0)
+        # A short word the VAD missed, well above the noise floor, mid-gap.
+        tone = slice(3 * SAMPLE_RATE, 3 * SAMPLE_RATE + SAMPLE_RATE // 5)
+        audio[tone] += _sine(0.2, amplitude=0.05)
+
+        out = proc._reduce_noise_single(audio, [speech], SAMPLE_RATE)
+
+        assert np.array_equal(out[tone], audio[tone])
+
+    def test_region_edges_crossfade_into_gaps(self, proc):
+        rng = np.random.default_rng(2)
+        audio = (rng.standard_normal(SAMPLE_RATE * 3) * 0.0003).astype(np.float32)
+        speech = (SAMPLE_RATE, 2 * SAMPLE_RATE)
+        audio[speech[0]:speech[1]] += _sine(1.0)
+
+        out = proc._reduce_noise_single(audio, [speech], SAMPLE_RATE)
+
+        # The hop before the region starts at the original signal and the
+        # hop after it ends there, with no step at the outer boundary.
+        lead, tail = speech[0] - 512, speech[1] + 512
+        assert out[lead] == audio[lead]
+        assert out[tail - 1] == pytest.approx(audio[tail - 1], abs=1e-7)
+        assert np.array_equal(out[:lead], audio[:lead])
+        assert np.array_equal(out[tail:], audio[tail:])
+
+    @pytest.mark.parametrize("n_frames", [1, 2, 7, 8])
+    def test_row_median_matches_np_median(self, proc, n_frames):
+        from whisper_voice.audio_processor import _row_median
+
+        values = np.random.default_rng(n_frames).random((5, n_frames)).astype(np.float32)
+        assert np.array_equal(_row_median(values), np.median(values, axis=1, keepdims=True))
+
+    def test_split_speech_regions_folds_short_pauses(self, proc):
+        regions, gaps = proc._split_speech_regions(
+            [(500, 8000), (8500, 12000), (40000, 47500)], 48000
+        )
+        assert regions == [(0, 12000), (40000, 48000)]
+        assert gaps == [(12000, 40000)]
+
+
 # ---------------------------------------------------------------------------
 # segment_long_audio
 # ---------------------------------------------------------------------------
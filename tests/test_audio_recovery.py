@@ -35,7 +35,6 @@ def test_hotkey_recording_resets_audio_host_after_all_zero_capture(monkeypatch):
     app = DummyApp()
     app._hold_recording = False
     app._key_interceptor = None
-    app._max_timer = None
     app._state_lock = threading.Lock()
     app._busy = False
     app.recorder = recorder
@@ -52,6 +51,43 @@ def test_hotkey_recording_resets_audio_host_after_all_zero_capture(monkeypatch):
     app._send_state_error.assert_called_once_with("Mic permission?")
 
 
+def test_stop_recording_releases_state_lock_during_recorder_stop(monkeypatch):
+    import whisper_voice.app_recording as recording_mod
+    from whisper_voice.app_recording import RecordingMixin
+
+    class DummyApp(RecordingMixin):
+        pass
+
+    app = DummyApp()
+    lock_held_during_stop = []
+
+    def stop():
+        lock_held_during_stop.append(app._state_lock.locked())
+        return np.zeros(32, dtype=np.float32)
+
+    app._hold_recording = False
+    app._key_interceptor = None
+    app._state_lock = threading.Lock()
+    app._busy = False
+    app.recorder = SimpleNamespace(
+        recording=True,
+        stop=stop,
+        start_monitoring=Mock(),
+        reset_audio_host=Mock(),
+    )
+    app.config = SimpleNamespace(audio=SimpleNamespace(sample_rate=16000, min_duration=0))
+    app._send_state_error = Mock()
+
+    monkeypatch.setattr(recording_mod, "play_sound", Mock())
+    monkeypatch.setattr(recording_mod.threading, "Timer", _ImmediateTimer)
+
+    app._stop_recording()
+
+    assert lock_held_during_stop == [False]
+    assert app._busy is False
+    app.recorder.start_monitoring.assert_called_once_with()
+
+
 def test_cli_listen_resets_audio_host_after_all_zero_capture():
     from whisper_voice.app_commands import CommandsMixin
 
@@ -212,7 +248,6 @@ def test_start_recording_does_not_duplicate_generic_mic_error_log(monkeypatch):
     app._busy = False
     app._ready = True
     app._key_interceptor = None
-    app._max_timer = None
     app.config = SimpleNamespace(audio=SimpleNamespace(max_duration=0))
     app.recorder = SimpleNamespace(recording=False, start=Mock(return_value=False))
     app._send_state_error = Mock()
@@ -242,7 +277,6 @@ def test_start_recording_surfaces_recorder_error_message(monkeypatch):
     app._busy = False
     app._ready = True
     app._key_interceptor = None
-    app._max_timer = None
     app.config = SimpleNamespace(audio=SimpleNamespace(max_duration=0))
     app.recorder = SimpleNamespace(
         recording=False,
@@ -154,3 +154,29 @@ class TestSplitLossless:
         out, err = b._fix_in_chunks(text, 20, "proofread")
         assert err is None
         assert out == text
+
+    def test_parallel_fix_in_chunks_keeps_order_and_first_error(self):
+        import threading
+        import time
+
+        b = _make_backend()
+        b._CHUNK_WORKERS = 4
+        in_flight = []
+        lock = threading.Lock()
+
+        def slow_upper(chunk, mode_id):
+            with lock:
+                in_flight.append(chunk)
+            time.sleep(0.05 if chunk.startswith("a") else 0.0)
+            return chunk.upper(), None
+
+        b.fix_with_mode = slow_upper
+        text = "aaaa.\n\nbbbb.\n\ncccc."
+        out, err = b._fix_in_chunks(text, 6, "proofread")
+        assert err is None
+        assert out == text.upper()
+        assert len(in_flight) == 3
+
+        b.fix_with_mode = lambda chunk, mode_id: (chunk, "boom" if "b" in chunk else None)
+        out, err = b._fix_in_chunks(text, 6, "proofread")
+        assert (out, err) == (text, "boom")
@@ -108,6 +108,17 @@ class TestSaveAudio:
         wavs = list(b.audio_history_dir.glob("*.wav"))
         assert len(wavs) == 1
 
+    def test_save_audio_history_copy_matches_and_input_untouched(self, tmp_path):
+        b, _ = _make_backup(tmp_path)
+        audio = np.array([0.5, 2.0, -3.0, float("nan")], dtype=np.float32)
+        original = audio.copy()
+        b.save_audio(audio)
+        (history_wav,) = b.audio_history_dir.glob("*.wav")
+        assert history_wav.read_bytes() == b.audio_path.read_bytes()
+        _, _, _, frames = _read_wav(b.audio_path)
+        assert np.frombuffer(frames, dtype=np.int16).tolist() == [16383, 32767, -32767, 0]
+        assert np.array_equal(audio, original, equal_nan=True)
+
     def test_save_audio_clamps_values(self, tmp_path):
         b, _ = _make_backup(tmp_path)
         # Out-of-range and NaN values must not crash and must produce a valid WAV
@@ -32,7 +32,6 @@ def test_hold_recording_pastes_when_processing_finishes(monkeypatch):
     audio = np.ones(16000, dtype=np.float32)
     app._hold_recording = True
     app._key_interceptor = None
-    app._max_timer = None
     app._state_lock = threading.Lock()
     app._busy = False
     app.recorder = SimpleNamespace(
@@ -53,7 +52,7 @@ def test_hold_recording_pastes_when_processing_finishes(monkeypatch):
     assert _CapturedThread.calls
     assert _CapturedThread.calls[-1].kwargs["target"] is app._process
     assert _CapturedThread.calls[-1].kwargs["args"] == (audio,)
-    assert _CapturedThread.calls[-1].kwargs["kwargs"] == {"paste_at_cursor": True}
+    assert _CapturedThread.calls[-1].kwargs["kwargs"] == {"paste_at_cursor": True, "peak_level": 1.0}
 
 
 def test_hold_key_release_preserves_paste_route(monkeypatch):
@@ -71,7 +70,6 @@ def test_hold_key_release_preserves_paste_route(monkeypatch):
     app._hold_recording = True
     app._key_pressed = True
     app._key_interceptor = None
-    app._max_timer = None
     app._state_lock = threading.Lock()
     app._busy = False
     app.recorder = SimpleNamespace(
@@ -90,7 +88,7 @@ def test_hold_key_release_preserves_paste_route(monkeypatch):
 
     assert app._hold_recording is False
     assert _CapturedThread.calls
-    assert _CapturedThread.calls[-1].kwargs["kwargs"] == {"paste_at_cursor": True}
+    assert _CapturedThread.calls[-1].kwargs["kwargs"] == {"paste_at_cursor": True, "peak_level": 1.0}
 
 
 def test_double_tap_recording_keeps_default_output_route(monkeypatch):
@@ -104,7 +102,6 @@ def test_double_tap_recording_keeps_default_output_route(monkeypatch):
     audio = np.ones(16000, dtype=np.float32)
     app._hold_recording = False
     app._key_interceptor = None
-    app._max_timer = None
     app._state_lock = threading.Lock()
     app._busy = False
     app.recorder = SimpleNamespace(
@@ -121,7 +118,7 @@ def test_double_tap_recording_keeps_default_output_route(monkeypatch):
 
     app._stop_recording()
 
-    assert _CapturedThread.calls[-1].kwargs["kwargs"] == {"paste_at_cursor": False}
+    assert _CapturedThread.calls[-1].kwargs["kwargs"] == {"paste_at_cursor": False, "peak_level": 1.0}
 
 
 def test_hold_output_pastes_even_when_auto_paste_is_disabled():
@@ -154,3 +151,64 @@ def test_double_tap_output_copies_when_auto_paste_is_disabled():
     assert app._deliver_transcription_text("hello", paste_at_cursor=False) is True
     app._copy_to_clipboard.assert_called_once_with("hello", show_error=False)
     app._paste_text_at_cursor.assert_not_called()
+
+
+def test_copy_to_clipboard_writes_pasteboard_without_spawning(monkeypatch):
+    import whisper_voice.app_pipeline as pipeline_mod
+    from whisper_voice.app_pipeline import PipelineMixin
+
+    class DummyApp(PipelineMixin):
+        pass
+
+    pasteboard = Mock()
+    pasteboard.setString_forType_.return_value = True
+    monkeypatch.setattr(
+        pipeline_mod, "NSPasteboard", SimpleNamespace(generalPasteboard=lambda: pasteboard)
+    )
+    monkeypatch.setattr(pipeline_mod, "NSPasteboardTypeString", "public.utf8-plain-text")
+    run = Mock()
+    monkeypatch.setattr(pipeline_mod.subprocess, "run", run)
+
+    assert DummyApp()._copy_to_clipboard("hello") is True
+    pasteboard.clearContents.assert_called_once_with()
+    pasteboard.setString_forType_.assert_called_once_with("hello", "public.utf8-plain-text")
+    run.assert_not_called()
+
+
+def test_copy_to_clipboard_falls_back_to_pbcopy_without_appkit(monkeypatch):
+    import whisper_voice.app_pipeline as pipeline_mod
+    from whisper_voice.app_pipeline import PipelineMixin
+
+    class DummyApp(PipelineMixin):
+        pass
+
+    monkeypatch.setattr(pipeline_mod, "NSPasteboard", None)
+    run = Mock()
+    monkeypatch.setattr(pipeline_mod.subprocess, "run", run)
+
+    assert DummyApp()._copy_to_clipboard("hello") is True
+    assert run.call_args.args[0] == ["pbcopy"]
+    assert run.call_args.kwargs["input"] == b"hello"
+
+
+def test_duration_loop_auto_stops_at_max_duration():
+    from whisper_voice.app_recording import RecordingMixin
+
+    class DummyApp(RecordingMixin):
+        pass
+
+    app = DummyApp()
+    app.recorder = SimpleNamespace(
+        recording=True,
+        duration=3.0,
+        rms_level=0.2,
+        wait_for_stop=Mock(return_value=False),
+    )
+    app.config = SimpleNamespace(audio=SimpleNamespace(max_duration=3))
+    app.ipc = Mock()
+    app._auto_stop = Mock()
+
+    app._update_duration()
+
+    app._auto_stop.assert_called_once_with()
+    app.ipc.send_frame.assert_not_called()
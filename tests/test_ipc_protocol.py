@@ -10,8 +10,12 @@ The helpers below mirror the real payload shapes emitted by the service in
 """
 
 import json
+import threading
+import time
 from types import SimpleNamespace
 
+import pytest
+
 # ---------------------------------------------------------------------------
 # Helpers: message constructors that mirror the real Python→Swift payloads.
 # ---------------------------------------------------------------------------
@@ -444,3 +448,183 @@ class TestBufferOverflow:
         assert len(messages) == 2
         assert messages[0]["type"] == "state_update"
         assert messages[1]["type"] == "action"
+
+
+class TestPreEncodedFrames:
+    def test_frame_matches_dict_serialization(self):
+        from whisper_voice.ipc_server import recording_tick_frame
+
+        frame = recording_tick_frame(12.345, 0.0625)
+        expected = json.dumps(make_state_update(
+            "recording",
+            duration_seconds=12.345,
+            rms_level=0.0625,
+            text=None,
+            status_text="Recording...",
+        )) + "\n"
+
+        assert frame == expected.encode("utf-8")
+
+    def test_non_finite_values_encode_as_zero(self):
+        from whisper_voice.ipc_server import recording_tick_frame
+
+        frame = recording_tick_frame(float("inf"), float("nan"))
+        msg = json.loads(frame, parse_constant=lambda name: pytest.fail(f"emitted {name}"))
+
+        assert msg["duration_seconds"] == 0.0
+        assert msg["rms_level"] == 0.0
+
+    def test_idle_frame_matches_dict_serialization(self):
+        from whisper_voice.ipc_server import IDLE_STATE_FRAME
+
+        expected = json.dumps(make_state_update(
+            "idle",
+            duration_seconds=0.0,
+            rms_level=0.0,
+            text=None,
+            status_text="Ready",
+        )) + "\n"
+
+        assert IDLE_STATE_FRAME == expected.encode("utf-8")
+
+
+class TestStateCoalescing:
+    def _server_with_peer(self):
+        import socket
+
+        from whisper_voice.ipc_server import IPCServer
+
+        server = IPCServer()
+        ours, peer = socket.socketpair()
+        server._client = ours
+        return server, peer
+
+    def _read_messages(self, peer):
+        peer.settimeout(1.0)
+        buf = b""
+        while not buf.endswith(b"\n"):
+            buf += peer.recv(65536)
+        return [json.loads(line) for line in buf.splitlines() if line]
+
+    def test_burst_of_state_updates_collapses_to_latest(self):
+        from whisper_voice.ipc_server import recording_tick_frame
+
+        server, peer = self._server_with_peer()
+        for i in range(5):
+            server.send_frame(recording_tick_frame(float(i), 0.0))
+        server.send(make_state_update("processing"))
+
+        server._running = True
+        writer = threading.Thread(target=server._drain_state_updates, daemon=True)
+        writer.start()
+        try:
+            messages = self._read_messages(peer)
+        finally:
+            server.stop()
+            writer.join(timeout=1.0)
+
+        assert len(messages) == 1
+        assert messages[0]["phase"] == "processing"
+
+    def test_direct_message_flushes_pending_state_first(self):
+        server, peer = self._server_with_peer()
+        server.send(make_state_update("done"))
+        server.send({"type": "history_update", "entries": []})
+
+        messages = self._read_messages(peer)
+        assert [m["type"] for m in messages] == ["state_update", "history_update"]
+        assert messages[0]["phase"] == "done"
+        assert server._latest_state is None
+
+    def test_writer_thread_never_reorders_state_after_direct_send(self):
+        server, peer = self._server_with_peer()
+        frames = []
+
+        def read_all():
+            buf = b""
+            while True:
+                chunk = peer.recv(65536)
+                if not chunk:
+                    break
+                buf += chunk
+            frames.extend(json.loads(line) for line in buf.splitlines() if line)
+
+        # Stall the writer on its way into _send to widen any window between
+        # taking the pending state and holding the send lock.
+        original_send = server._send
+
+        def slow_writer_send(*args, **kwargs):
+            if threading.current_thread() is writer:
+                time.sleep(0.001)
+            return original_send(*args, **kwargs)
+
+        server._send = slow_writer_send
+        reader = threading.Thread(target=read_all, daemon=True)
+        reader.start()
+        server._running = True
+        writer = threading.Thread(target=server._drain_state_updates, daemon=True)
+        writer.start()
+        try:
+            for i in range(100):
+                server.send(make_state_update("done", text=str(i)))
+                time.sleep(0.0002)  # let the writer wake and claim the state
+                server.send({"type": "history_update", "seq": i})
+        finally:
+            server.stop()
+            writer.join(timeout=1.0)
+            reader.join(timeout=2.0)
+
+        last_state = -1
+        for frame in frames:
+            if frame["type"] == "state_update":
+                seq = int(frame["text"])
+                assert seq > last_state, "older state sent after a newer one"
+                last_state = seq
+            else:
+                # The state posted just before this message is already out.
+                assert last_state == frame["seq"]
+        assert [f["seq"] for f in frames if f["type"] == "history_update"] == list(range(100))
+
+
+class TestWriteWithTimeout:
+    def test_undrained_peer_times_out(self, monkeypatch):
+        import socket
+
+        from whisper_voice import ipc_server
+        from whisper_voice.ipc_server import IPCServer
+
+        monkeypatch.setattr(ipc_server, "_SEND_READY_TIMEOUT", 0.05)
+        server = IPCServer()
+        ours, peer = socket.socketpair()
+        try:
+            with pytest.raises(TimeoutError):
+                server._write_with_timeout(ours, b"x" * (8 << 20))
+        finally:
+            ours.close()
+            peer.close()
+
+
+class TestReadLoop:
+    def test_split_and_batched_lines_are_dispatched_in_order(self):
+        import socket
+
+        from whisper_voice.ipc_server import IPCServer
+
+        server = IPCServer()
+        received = []
+        server.set_message_handler(received.append)
+        ours, peer = socket.socketpair()
+        server._running = True
+        reader = threading.Thread(target=server._read_loop, args=(ours,), daemon=True)
+        reader.start()
+        try:
+            peer.sendall(b'{"type": "action", "ac')
+            peer.sendall(b'tion": "a"}\n\n{"type": "action", "action": "b"}\nnot json\n')
+            peer.sendall(b'{"type": "action", "action": "c"}\n')
+            peer.close()
+            reader.join(timeout=1.0)
+            server._dispatch_pool.shutdown(wait=True)
+        finally:
+            server.stop()
+
+        assert [m["action"] for m in received] == ["a", "b", "c"]
@@ -80,6 +80,34 @@ def test_source_update_uses_fast_forward_pull_and_waits_for_ready(monkeypatch, t
     assert statuses[-1] == ("processing", "Updating: restarting service...")
 
 
+def test_source_update_steps_keep_posix_spawn_eligible(monkeypatch, tmp_path):
+    spawn_kwargs = []
+
+    def fake_run(cmd, *args, **kwargs):
+        spawn_kwargs.append(kwargs)
+        return _ok()
+
+    def fake_check_output(cmd, **kwargs):
+        spawn_kwargs.append(kwargs)
+        return "abc123\n"
+
+    monkeypatch.setattr(doctor, "get_install_method", lambda: doctor.INSTALL_SOURCE)
+    monkeypatch.setattr(doctor.Path, "resolve", lambda self: tmp_path / "src/whisper_voice/cli/doctor.py")
+    monkeypatch.setattr(doctor, "_get_venv_python", lambda: "/tmp/python")
+    monkeypatch.setattr(doctor.shutil, "which", lambda name: {"git": "/usr/bin/git"}.get(name))
+    monkeypatch.setattr(doctor.subprocess, "run", fake_run)
+    monkeypatch.setattr(doctor.subprocess, "check_output", fake_check_output)
+    monkeypatch.setattr(doctor, "_update_models", lambda required=False: True)
+    monkeypatch.setattr(
+        "whisper_voice.cli.build._local_whisper_ui_sources_newer_than_binary",
+        lambda: False,
+    )
+
+    assert doctor.cmd_update(restart_callback=lambda: None)
+    assert spawn_kwargs
+    assert all(kw.get("close_fds") is False and "cwd" not in kw for kw in spawn_kwargs)
+
+
 def test_update_fails_before_restart_when_active_model_cannot_prepare(monkeypatch):
     calls = []
 
@@ -223,6 +223,18 @@ class TestMicrophonePermission:
         popen.assert_called_once()
 
 
+# ---------------------------------------------------------------------------
+# Thread QoS
+# ---------------------------------------------------------------------------
+
+class TestThreadQos:
+    def test_non_darwin_is_a_no_op(self):
+        u = _import_utils()
+
+        with patch.object(u.sys, "platform", "linux"):
+            assert u.set_thread_qos(u.QOS_CLASS_USER_INITIATED) is False
+
+
 # ---------------------------------------------------------------------------
 # HALLUCINATION_PATTERNS list
 # ---------------------------------------------------------------------------